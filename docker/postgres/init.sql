@@ -7,6 +7,7 @@
 -- Create some basic extensions that might be useful
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "citext";
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 -- You can add initial table schemas here in the future
 -- For now, we're keeping it minimal as requested
@@ -9,6 +9,7 @@ from typing import Optional
 
 from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import select
 
 from wave_backend.api.middleware.versioning import VersioningMiddleware
 from wave_backend.api.routes import (
@@ -18,8 +19,15 @@ from wave_backend.api.routes import (
     search,
     tags,
 )
-from wave_backend.models.database import engine
-from wave_backend.models.models import Base
+from wave_backend.models.database import AsyncSessionLocal, engine
+from wave_backend.models.models import (
+    Base,
+    ExperimentType,
+    create_missing_indexes,
+    ensure_trigram_indexes,
+)
+from wave_backend.services.experiment_data import ExperimentDataService
+from wave_backend.services.experiments import ExperimentService
 from wave_backend.utils.logging import get_logger
 from wave_backend.utils.versioning import (
     API_VERSION,
@@ -54,6 +62,7 @@ async def lifespan(app: FastAPI):
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(create_missing_indexes)
         logger.info("Database tables created/verified")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
@@ -64,6 +73,22 @@ async def lifespan(app: FastAPI):
         logger.error("Application will exit now.")
         sys.exit(1)
 
+    # Optional: without pg_trgm, substring searches still work, only unindexed
+    if await ensure_trigram_indexes(engine):
+        logger.info("Trigram search indexes created/verified")
+
+    # Prewarm the reflection caches: experiments columns and every experiment data table
+    # in one reflection pass, so requests never reflect lazily
+    try:
+        async with AsyncSessionLocal() as session:
+            await ExperimentService.get_base_columns(session)
+            result = await session.execute(select(ExperimentType.table_name))
+            table_names = list(result.scalars())
+            tables = await ExperimentDataService.reflect_many(table_names, session)
+        logger.info(f"Prewarmed {len(tables)} experiment data tables")
+    except Exception as e:
+        logger.warning(f"Could not prewarm experiment data tables: {e}")
+
     yield
 
     # Shutdown
@@ -12,6 +12,8 @@ from wave_backend.auth.roles import Role
 from wave_backend.models.database import get_db
 from wave_backend.schemas.schemas import (
     ColumnTypeInfo,
+    ExperimentDataBulkCreate,
+    ExperimentDataBulkCreateResponse,
     ExperimentDataCountResponse,
     ExperimentDataCreate,
     ExperimentDataDeleteResponse,
@@ -61,15 +63,15 @@ async def create_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Create a new experiment data row with the provided data values."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Insert the data row
     try:
         row_id = await ExperimentDataService.insert_data_row(
-            experiment.experiment_type.table_name,
+            table_name,
             str(experiment_id),
             data.participant_id,
             data.data,
@@ -81,13 +83,56 @@ async def create_experiment_data(
     if row_id is None:
         raise HTTPException(status_code=400, detail="Failed to create experiment data row")
 
-    # Return the created row
-    row = await ExperimentDataService.get_data_row_by_id(
-        experiment.experiment_type.table_name, row_id, db, str(experiment_id)
-    )
+    # Return the created row, committing once for the insert and read-back
+    row = await ExperimentDataService.get_data_row_by_id(table_name, row_id, db, str(experiment_id))
+    await db.commit()
     return row
 
 
+@router.post(
+    "/{experiment_id}/data/bulk",
+    response_model=ExperimentDataBulkCreateResponse,
+    summary="Create experiment data rows in bulk",
+    description="Create many data rows for the specified experiment in one request. "
+    "Rows are inserted atomically: if any row is invalid, none are created. "
+    "Returns the IDs of the created rows in request order.",
+    status_code=201,
+)
+@auth.role(Role.EXPERIMENTEE)
+async def create_experiment_data_bulk(
+    experiment_id: UUID,
+    data: ExperimentDataBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    auth: Tuple[str, Role] = None,  # noqa: F841
+):
+    """Create several experiment data rows with a single batched insert."""
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
+        raise HTTPException(status_code=404, detail="Experiment not found")
+
+    rows = [{**row.data, "participant_id": row.participant_id} for row in data.rows]
+
+    # Insert the data rows
+    try:
+        row_ids = await ExperimentDataService.insert_data_rows(
+            table_name,
+            str(experiment_id),
+            rows,
+            db,
+            autocommit=True,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if row_ids is None:
+        raise HTTPException(status_code=400, detail="Failed to create experiment data rows")
+
+    return ExperimentDataBulkCreateResponse(
+        experiment_id=experiment_id, row_ids=row_ids, count=len(row_ids)
+    )
+
+
 @router.get(
     "/{experiment_id}/data/",
     response_model=List[Dict[str, Any]],
@@ -142,14 +187,14 @@ async def get_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Get experiment data rows with filtering and pagination options."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Get the data rows
     rows = await ExperimentDataService.get_data_rows(
-        experiment.experiment_type.table_name,
+        table_name,
         db,
         experiment_uuid=str(experiment_id),
         participant_id=participant_id,
@@ -177,14 +222,14 @@ async def count_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Count experiment data rows with optional participant filtering."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Count the rows
     count = await ExperimentDataService.count_data_rows(
-        experiment.experiment_type.table_name,
+        table_name,
         db,
         experiment_uuid=str(experiment_id),
         participant_id=participant_id,
@@ -211,15 +256,13 @@ async def get_experiment_data_columns(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Get detailed column information for an experiment's data table schema."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Get column information
-    columns = await ExperimentDataService.get_table_columns(
-        experiment.experiment_type.table_name, db
-    )
+    columns = await ExperimentDataService.get_table_columns(table_name, db)
 
     return [
         ColumnTypeInfo(
@@ -267,15 +310,13 @@ async def get_experiment_data_row(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Get a specific experiment data row by its unique ID."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Get the data row
-    row = await ExperimentDataService.get_data_row_by_id(
-        experiment.experiment_type.table_name, row_id, db, str(experiment_id)
-    )
+    row = await ExperimentDataService.get_data_row_by_id(table_name, row_id, db, str(experiment_id))
 
     if not row:
         raise HTTPException(status_code=404, detail="Experiment data row not found")
@@ -319,9 +360,9 @@ async def update_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Update an experiment data row with partial or complete data changes."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Prepare update data
@@ -333,16 +374,15 @@ async def update_experiment_data(
 
     # Update the data row
     success = await ExperimentDataService.update_data_row(
-        experiment.experiment_type.table_name, row_id, update_data, db, str(experiment_id)
+        table_name, row_id, update_data, db, str(experiment_id)
     )
 
     if not success:
         raise HTTPException(status_code=404, detail="Experiment data row not found")
 
-    # Return the updated row
-    row = await ExperimentDataService.get_data_row_by_id(
-        experiment.experiment_type.table_name, row_id, db, str(experiment_id)
-    )
+    # Return the updated row, committing once for the update and read-back
+    row = await ExperimentDataService.get_data_row_by_id(table_name, row_id, db, str(experiment_id))
+    await db.commit()
     return row
 
 
@@ -360,14 +400,14 @@ async def delete_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Delete an experiment data row and return confirmation details."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Delete the data row
     success = await ExperimentDataService.delete_data_row(
-        experiment.experiment_type.table_name, row_id, db, str(experiment_id)
+        table_name, row_id, db, str(experiment_id), autocommit=True
     )
 
     if not success:
@@ -427,9 +467,9 @@ async def query_experiment_data(
     auth: Tuple[str, Role] = None,  # noqa: F841
 ):
     """Run an advanced query on experiment data with custom filters and pagination."""
-    # Get the experiment to get the table name
-    experiment = await ExperimentService.get_experiment(db, experiment_id)
-    if not experiment:
+    # Get the experiment's data table name
+    table_name = await ExperimentService.get_experiment_table_name(db, experiment_id)
+    if not table_name:
         raise HTTPException(status_code=404, detail="Experiment not found")
 
     # Extract query parameters from the request model
@@ -439,10 +479,13 @@ async def query_experiment_data(
     created_before = query_request.created_before
     limit = query_request.limit
     offset = query_request.offset
+    columns = query_request.columns
+    after_created_at = query_request.after_created_at
+    after_id = query_request.after_id
 
     # Run the query
     rows = await ExperimentDataService.get_data_rows(
-        experiment.experiment_type.table_name,
+        table_name,
         db,
         experiment_uuid=str(experiment_id),
         participant_id=participant_id,
@@ -451,6 +494,9 @@ async def query_experiment_data(
         created_before=created_before,
         limit=limit,
         offset=offset,
+        columns=columns,
+        after_created_at=after_created_at,
+        after_id=after_id,
     )
 
     return rows
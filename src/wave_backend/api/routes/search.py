@@ -1,8 +1,10 @@
 """Search API endpoints for advanced querying capabilities."""
 
-from typing import Tuple
+from typing import Any, List, Sequence, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wave_backend.auth.decorator import auth
@@ -29,6 +31,30 @@ from wave_backend.services.search import SearchService
 
 router = APIRouter(prefix="/api/v1/search", tags=["Search"])
 
+# Built once at import so every list response reuses the same compiled validator/serializer
+_EXPERIMENT_LIST_ADAPTER = TypeAdapter(List[ExperimentResponse])
+_EXPTYPE_LIST_ADAPTER = TypeAdapter(List[ExperimentTypeResponse])
+_TAG_LIST_ADAPTER = TypeAdapter(List[TagResponse])
+
+
+def _list_response(
+    adapter: TypeAdapter, key: str, items: Sequence[Any], skip: int, limit: int
+) -> JSONResponse:
+    """Serialize ORM search results with a cached adapter into the search response shape.
+
+    Returning a response directly skips FastAPI's second pass through ``response_model``,
+    which is kept on the routes for the OpenAPI schema only.
+    """
+    rows = adapter.dump_python(adapter.validate_python(items, from_attributes=True), mode="json")
+    total = len(rows)
+    return JSONResponse(
+        content={
+            key: rows,
+            "total": total,
+            "pagination": {"skip": skip, "limit": limit, "total": total},
+        }
+    )
+
 
 @router.post("/experiments/by-tags", response_model=ExperimentTagSearchResponse)
 @auth.role(Role.RESEARCHER)
@@ -49,10 +75,8 @@ async def search_experiments_by_tags(
             created_before=request.created_before,
         )
 
-        return ExperimentTagSearchResponse(
-            experiments=[ExperimentResponse.model_validate(exp) for exp in experiments],
-            total=len(experiments),
-            pagination={"skip": request.skip, "limit": request.limit, "total": len(experiments)},
+        return _list_response(
+            _EXPERIMENT_LIST_ADAPTER, "experiments", experiments, request.skip, request.limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -76,14 +100,12 @@ async def search_experiment_types_by_description(
             created_before=request.created_before,
         )
 
-        return ExperimentTypeSearchResponse(
-            experiment_types=[ExperimentTypeResponse.model_validate(et) for et in experiment_types],
-            total=len(experiment_types),
-            pagination={
-                "skip": request.skip,
-                "limit": request.limit,
-                "total": len(experiment_types),
-            },
+        return _list_response(
+            _EXPTYPE_LIST_ADAPTER,
+            "experiment_types",
+            experiment_types,
+            request.skip,
+            request.limit,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -107,11 +129,7 @@ async def search_tags_by_name(
             created_before=request.created_before,
         )
 
-        return TagSearchResponse(
-            tags=[TagResponse.model_validate(tag) for tag in tags],
-            total=len(tags),
-            pagination={"skip": request.skip, "limit": request.limit, "total": len(tags)},
-        )
+        return _list_response(_TAG_LIST_ADAPTER, "tags", tags, request.skip, request.limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
@@ -135,10 +153,8 @@ async def search_experiments_by_description_and_type(
             created_before=request.created_before,
         )
 
-        return ExperimentTagSearchResponse(
-            experiments=[ExperimentResponse.model_validate(exp) for exp in experiments],
-            total=len(experiments),
-            pagination={"skip": request.skip, "limit": request.limit, "total": len(experiments)},
+        return _list_response(
+            _EXPERIMENT_LIST_ADAPTER, "experiments", experiments, request.skip, request.limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -165,10 +181,8 @@ async def advanced_experiment_search(
             limit=request.limit,
         )
 
-        return ExperimentTagSearchResponse(
-            experiments=[ExperimentResponse.model_validate(exp) for exp in experiments],
-            total=len(experiments),
-            pagination={"skip": request.skip, "limit": request.limit, "total": len(experiments)},
+        return _list_response(
+            _EXPERIMENT_LIST_ADAPTER, "experiments", experiments, request.skip, request.limit
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -21,8 +21,7 @@ async def create_tag(
 ):  # noqa: F841
     """Create a new tag."""
     # Check if tag with same name already exists
-    existing_tag = await TagService.get_tag_by_name(db, tag.name)
-    if existing_tag:
+    if await TagService.tag_name_exists(db, tag.name):
         raise HTTPException(status_code=400, detail="Tag with this name already exists")
 
     try:
@@ -68,8 +67,7 @@ async def update_tag(
     """Update a tag."""
     # If updating name, check for conflicts
     if tag_update.name:
-        existing_tag = await TagService.get_tag_by_name(db, tag_update.name)
-        if existing_tag and existing_tag.id != tag_id:
+        if await TagService.tag_name_exists(db, tag_update.name, exclude_id=tag_id):
             raise HTTPException(status_code=400, detail="Tag with this name already exists")
 
     db_tag = await TagService.update_tag(db, tag_id, tag_update)
@@ -40,4 +40,8 @@ class Role(IntEnum):
 
     def __str__(self) -> str:
         """Return lowercase string representation of role."""
-        return self.name.lower()
+        return _ROLE_NAMES[self]
+
+
+# Lowercase names built once; str(role) runs for every authorized request
+_ROLE_NAMES = {role: role.name.lower() for role in Role}
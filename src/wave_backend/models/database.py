@@ -5,7 +5,11 @@ from sqlalchemy.orm import DeclarativeBase
 
 from wave_backend.models.database_config import db_config
 
-engine = create_async_engine(db_config.get_database_url(), echo=db_config.echo)
+engine = create_async_engine(
+    db_config.get_database_url(),
+    echo=db_config.echo,
+    connect_args={"prepared_statement_cache_size": db_config.prepared_statement_cache_size},
+)
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
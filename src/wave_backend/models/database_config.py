@@ -28,6 +28,11 @@ class DatabaseConfig:
         # SQLAlchemy configuration
         self.echo: bool = os.getenv("SQLALCHEMY_ECHO", "false").lower() in ("true", "1", "yes")
 
+        # asyncpg prepared statements cached per connection (asyncpg dialect default is 100)
+        self.prepared_statement_cache_size: int = int(
+            os.getenv("SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE", "500")
+        )
+
     def get_database_url(self, test: bool = False) -> str:
         """Get the complete database URL.
 
@@ -2,13 +2,40 @@
 
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.sql import func
 
 from wave_backend.models.database import Base
+from wave_backend.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Trigram indexes back the substring (ILIKE '%...%') text searches. They need the pg_trgm
+# extension, which the database role may not be allowed to create, so they are built by
+# ensure_trigram_indexes rather than declared on the tables for create_all
+_TRIGRAM_INDEXED_COLUMNS = (
+    ("tags", "name"),
+    ("tags", "description"),
+    ("experiment_types", "name"),
+    ("experiment_types", "description"),
+    ("experiments", "description"),
+)
 
 
 class Tag(Base):
@@ -44,6 +71,12 @@ class Experiment(Base):
     """Base model for experiments."""
 
     __tablename__ = "experiments"
+    __table_args__ = (
+        # GIN index so tag containment (@>) filters use an index scan
+        Index("ix_experiments_tags_gin", "tags", postgresql_using="gin"),
+        # Serves "latest experiments of a type" without sorting the filtered set
+        Index("ix_experiments_type_created", "experiment_type_id", text("created_at DESC")),
+    )
 
     uuid = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
     experiment_type_id = Column(Integer, ForeignKey("experiment_types.id"), nullable=False)
@@ -55,3 +88,37 @@ class Experiment(Base):
 
     # Relationship to experiment type
     experiment_type = relationship("ExperimentType", back_populates="experiments")
+
+
+def create_missing_indexes(sync_conn) -> None:
+    """Create declared indexes that create_all skipped because their table already existed.
+
+    create_all only builds indexes together with a new table, so indexes added to a model
+    later reach existing databases through this. Every statement is IF NOT EXISTS.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+async def ensure_trigram_indexes(engine: AsyncEngine) -> bool:
+    """Enable pg_trgm and create any missing trigram indexes.
+
+    Every statement is idempotent, so this runs on each startup and also reaches databases
+    whose tables existed before the indexes were introduced. Returns False, leaving
+    substring searches unindexed, if pg_trgm cannot be enabled.
+    """
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for table_name, column_name in _TRIGRAM_INDEXED_COLUMNS:
+                await conn.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{column_name}_trgm "
+                        f"ON {table_name} USING gin ({column_name} gin_trgm_ops)"
+                    )
+                )
+    except SQLAlchemyError as e:
+        logger.warning(f"Skipping trigram indexes, pg_trgm could not be enabled: {e}")
+        return False
+    return True
@@ -1,15 +1,31 @@
 """Pydantic schemas for API requests and responses."""
 
+import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    Tag,
+    field_validator,
+    model_validator,
+)
 
 from wave_backend.schemas.column_types import TYPE_MAPPING
 
 # Supported column types for experiment data tables
 SUPPORTED_COLUMN_TYPES = list(TYPE_MAPPING.keys())
+_SUPPORTED_COLUMN_TYPES_SET = frozenset(SUPPORTED_COLUMN_TYPES)
+_SUPPORTED_COLUMN_TYPES_TEXT = ", ".join(SUPPORTED_COLUMN_TYPES)
+
+# Columns every experiment data table defines itself
+_RESERVED_COLUMN_NAMES = frozenset(
+    {"id", "experiment_uuid", "participant_id", "created_at", "updated_at"}
+)
 
 
 class ColumnDefinition(BaseModel):
@@ -17,19 +33,19 @@ class ColumnDefinition(BaseModel):
 
     type: str = Field(
         ...,
-        description=f"Column data type. Supported types: {', '.join(SUPPORTED_COLUMN_TYPES)}",
+        description=f"Column data type. Supported types: {_SUPPORTED_COLUMN_TYPES_TEXT}",
         examples=["INTEGER", "FLOAT", "STRING", "TEXT", "BOOLEAN", "DATETIME", "JSON"],
     )
     nullable: bool = Field(default=True, description="Whether the column can contain null values")
 
     @field_validator("type")
     def validate_column_type(cls, v):
-        if v.upper() not in SUPPORTED_COLUMN_TYPES:
+        column_type = v.upper()
+        if column_type not in _SUPPORTED_COLUMN_TYPES_SET:
             raise ValueError(
-                f"Unsupported column type: {v}. "
-                f"Supported types: {', '.join(SUPPORTED_COLUMN_TYPES)}"
+                f"Unsupported column type: {v}. Supported types: {_SUPPORTED_COLUMN_TYPES_TEXT}"
             )
-        return v.upper()
+        return column_type
 
 
 class TagBase(BaseModel):
@@ -71,6 +87,18 @@ class TagResponse(TagBase):
     updated_at: datetime
 
 
+def _column_kind(value: Any) -> str:
+    """Route bare type strings and full column definitions to their union arm."""
+    return "bare" if isinstance(value, str) else "full"
+
+
+# Tagged so pydantic-core dispatches each value straight to one arm instead of trying both
+ColumnSpec = Annotated[
+    Union[Annotated[str, Tag("bare")], Annotated[ColumnDefinition, Tag("full")]],
+    Discriminator(_column_kind),
+]
+
+
 class ExperimentTypeBase(BaseModel):
     """Base schema for experiment types."""
 
@@ -95,7 +123,7 @@ class ExperimentTypeBase(BaseModel):
         description="Database table name for storing experiment data",
         examples=["cognitive_test_data", "memory_test_results", "attention_measurements"],
     )
-    schema_definition: Dict[str, Union[str, ColumnDefinition]] = Field(
+    schema_definition: Dict[str, ColumnSpec] = Field(
         default_factory=dict,
         description="Schema definition for additional columns specific to this experiment type. "
         "Can be either a string (column type) or a ColumnDefinition object.",
@@ -112,30 +140,23 @@ class ExperimentTypeBase(BaseModel):
     @field_validator("schema_definition")
     def validate_schema_definition(cls, v):
         """Validate that all column types are supported and reserved names are not used."""
-        reserved_names = {"id", "experiment_uuid", "participant_id", "created_at", "updated_at"}
+        reserved_names = _RESERVED_COLUMN_NAMES
+        supported_types = _SUPPORTED_COLUMN_TYPES_SET
+        interned = {}
 
         for column_name, column_def in v.items():
+            interned[sys.intern(column_name)] = column_def
             if column_name.lower() in reserved_names:
                 raise ValueError(f"Column name '{column_name}' is reserved and cannot be used")
 
-            if isinstance(column_def, str):
-                if column_def.upper() not in SUPPORTED_COLUMN_TYPES:
-                    raise ValueError(
-                        f"Unsupported column type: {column_def}. "
-                        f"Supported types: {', '.join(SUPPORTED_COLUMN_TYPES)}"
-                    )
-            elif isinstance(column_def, dict):
-                if "type" not in column_def:
-                    raise ValueError(
-                        f"Column definition for '{column_name}' must include 'type' field"
-                    )
-                if column_def["type"].upper() not in SUPPORTED_COLUMN_TYPES:
-                    raise ValueError(
-                        f"Unsupported column type: {column_def['type']}. "
-                        f"Supported types: {', '.join(SUPPORTED_COLUMN_TYPES)}"
-                    )
-
-        return v
+            # ColumnDefinition instances validate their own type
+            if type(column_def) is str and column_def.upper() not in supported_types:
+                raise ValueError(
+                    f"Unsupported column type: {column_def}. "
+                    f"Supported types: {_SUPPORTED_COLUMN_TYPES_TEXT}"
+                )
+
+        return interned
 
 
 class ExperimentTypeCreate(ExperimentTypeBase):
@@ -268,6 +289,33 @@ class ExperimentDataCreate(BaseModel):
     )
 
 
+class ExperimentDataBulkCreate(BaseModel):
+    """Schema for creating several experiment data rows in one request."""
+
+    rows: List[ExperimentDataCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Data rows to insert, each with its participant ID and column values",
+    )
+
+
+class ExperimentDataBulkCreateResponse(BaseModel):
+    """Schema for bulk experiment data creation responses."""
+
+    experiment_id: UUID = Field(
+        ...,
+        description="UUID of the experiment the rows were added to",
+        examples=["550e8400-e29b-41d4-a716-446655440000"],
+    )
+    row_ids: List[int] = Field(
+        ...,
+        description="IDs of the created rows, in the same order as the request",
+        examples=[[1, 2, 3]],
+    )
+    count: int = Field(..., ge=0, description="Number of rows created", examples=[3])
+
+
 class ExperimentDataUpdate(BaseModel):
     """Schema for updating experiment data rows."""
 
@@ -347,6 +395,34 @@ class ExperimentDataQueryRequest(BaseModel):
         description="Number of rows to skip for pagination",
         examples=[0, 10, 50, 100],
     )
+    columns: Optional[List[str]] = Field(
+        None,
+        description="Only return these columns. Unknown names are ignored; "
+        "omit to return every column.",
+        examples=[["id", "participant_id", "reaction_time"]],
+    )
+    after_created_at: Optional[datetime] = Field(
+        None,
+        description="Keyset pagination: created_at of the last row from the previous page",
+        examples=["2024-01-15T10:30:00"],
+    )
+    after_id: Optional[int] = Field(
+        None,
+        description="Keyset pagination: id of the last row from the previous page",
+        examples=[42],
+    )
+
+    @field_validator("filters")
+    def intern_filter_keys(cls, v):
+        """Intern filter keys so column lookups hit the cached hash and identity check."""
+        return {sys.intern(key): value for key, value in v.items()}
+
+    @model_validator(mode="after")
+    def validate_keyset_cursor(self):
+        """Validate that keyset pagination fields are given together."""
+        if (self.after_created_at is None) != (self.after_id is None):
+            raise ValueError("after_created_at and after_id must be provided together")
+        return self
 
 
 class ExperimentDataCountResponse(BaseModel):
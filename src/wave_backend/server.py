@@ -1,10 +1,41 @@
 """
 ASGI server entry point for the WAVE Backend API.
+
+Set FASTAPI_RELOAD=true for a single auto-reloading development worker. Otherwise the
+server runs FASTAPI_WORKERS workers (default: one per CPU, at most 4) on uvloop and
+httptools (both pulled in by uvicorn[standard]). Each worker has its own database pool.
 """
 
+import os
+
+# Upper bound on the default worker count; every worker opens its own database pool
+DEFAULT_MAX_WORKERS = 4
+
 if __name__ == "__main__":
     import uvicorn
+    from dotenv import load_dotenv
+
+    from wave_backend.utils.constants import ROOT_DIR
+
+    # Read .env before the server settings so values set only there take effect
+    load_dotenv(ROOT_DIR / ".env")
+
+    host = os.getenv("FASTAPI_HOST", "0.0.0.0")
+    port = int(os.getenv("FASTAPI_PORT", "8000"))
+    reload = os.getenv("FASTAPI_RELOAD", "false").lower() in ("true", "1", "yes")
+    workers = int(os.getenv("FASTAPI_WORKERS", str(min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS))))
 
-    uvicorn.run(
-        "wave_backend.api.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info"
-    )
+    if reload:
+        uvicorn.run(
+            "wave_backend.api.main:app", host=host, port=port, reload=True, log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "wave_backend.api.main:app",
+            host=host,
+            port=port,
+            log_level="info",
+            loop="uvloop",
+            http="httptools",
+            workers=workers,
+        )
@@ -1,16 +1,25 @@
 """Service for managing experiment data with dynamic tables."""
 
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
-
+import hashlib
+import re
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+import asyncpg
 from sqlalchemy import (
     Column,
     DateTime,
+    Index,
     Integer,
     MetaData,
     String,
     Table,
+    TextClause,
+    bindparam,
     func,
+    tuple_,
 )
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.exc import SQLAlchemyError
@@ -22,26 +31,185 @@ from wave_backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Below this many rows a multi-row INSERT beats the fixed cost of setting up a COPY
+COPY_MIN_ROWS = 100
+
+# Unfiltered counts on tables the planner estimates at least this large use the estimate
+ESTIMATED_COUNT_MIN_ROWS = 100_000
+
+# Table names that are safe to interpolate into raw SQL once quoted
+_PLAIN_TABLE_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,62}")
+
+# PostgreSQL identifier limit; SQLAlchemy refuses to compile longer explicit index names
+_MAX_IDENTIFIER_LENGTH = 63
+
+# Columns the server fills in; clients may not write them
+_SERVER_MANAGED_COLUMNS = frozenset({"id", "experiment_uuid", "created_at", "updated_at"})
+
+# Shared by every dynamic table the service creates or reflects
+_metadata = MetaData()
+
+
+def _index_name(table_name: str, suffix: str) -> str:
+    """Name an index ``ix_<table>_<suffix>``, shortened with a stable hash if too long."""
+    name = f"ix_{table_name}_{suffix}"
+    if len(name) <= _MAX_IDENTIFIER_LENGTH:
+        return name
+    digest = hashlib.md5(name.encode()).hexdigest()[:8]
+    return f"{name[: _MAX_IDENTIFIER_LENGTH - len(digest) - 1]}_{digest}"
+
+
+_RAW_BY_ID_SQL = {
+    "select": "SELECT * FROM {table} WHERE id = :_row_id",
+    "delete": "DELETE FROM {table} WHERE id = :_row_id",
+}
+
 
 class ExperimentDataService:
     """Service for managing experiment data in dynamic tables using SQLAlchemy ORM."""
 
-    # Map schema definition types to SQLAlchemy types
+    # Reflected dynamic tables, keyed by table name; their schema never changes after creation
+    _table_cache: Dict[str, Table] = {}
+    _column_set_cache: Dict[str, frozenset[str]] = {}
+    _statement_cache: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def _forget_table(cls, table_name: str) -> None:
+        """Drop a table from the reflection cache so the next access reflects it again."""
+        cls._table_cache.pop(table_name, None)
+        cls._column_set_cache.pop(table_name, None)
+        cls._statement_cache.pop(table_name, None)
+        table = _metadata.tables.get(table_name)
+        if table is not None:
+            _metadata.remove(table)
+
+    @classmethod
+    def _column_names(cls, table: Table) -> frozenset[str]:
+        """Get the cached set of column names for a table."""
+        column_names = cls._column_set_cache.get(table.name)
+        if column_names is None:
+            column_names = frozenset(table.c.keys())
+            cls._column_set_cache[table.name] = column_names
+        return column_names
+
+    @classmethod
+    def _statements(cls, table: Table) -> Dict[str, Any]:
+        """Get the cached single-row statements for a table.
+
+        Row IDs and experiment UUIDs are bound at execution time as ``_row_id`` and
+        ``_experiment_uuid``, so each statement is built and compiled once per table.
+        """
+        statements = cls._statement_cache.get(table.name)
+        if statements is None:
+            by_id = table.c.id == bindparam("_row_id")
+            by_experiment = table.c.experiment_uuid == bindparam("_experiment_uuid")
+            statements = {
+                "insert": insert(table).returning(table.c.id),
+                "select": select(table).where(by_id),
+                "select_scoped": select(table).where(by_id, by_experiment),
+                # Reflected columns carry no onupdate, so stamp updated_at in the statement
+                "update": update(table).where(by_id).values(updated_at=func.now()),
+                "update_scoped": update(table)
+                .where(by_id, by_experiment)
+                .values(updated_at=func.now()),
+                "delete": delete(table).where(by_id),
+                "delete_scoped": delete(table).where(by_id, by_experiment),
+            }
+            cls._statement_cache[table.name] = statements
+        return statements
+
+    @classmethod
+    def _by_id(
+        cls, table: Table, operation: str, row_id: int, experiment_uuid: Optional[str]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Get a cached by-ID statement and its parameters, scoped to an experiment if given."""
+        statements = cls._statements(table)
+        # Optionally filter by experiment_uuid for additional security
+        if experiment_uuid:
+            return statements[f"{operation}_scoped"], {
+                "_row_id": row_id,
+                "_experiment_uuid": experiment_uuid,
+            }
+        return statements[operation], {"_row_id": row_id}
+
+    @staticmethod
+    def _unchecked_table_guard(query: Any, db: AsyncSession):
+        """Wrap raw by-ID SQL, whose table is not known to exist, in a SAVEPOINT.
+
+        A missing table then rolls back only the SAVEPOINT instead of aborting the caller's
+        transaction, so the session stays usable.
+        """
+        return db.begin_nested() if isinstance(query, TextClause) else nullcontext()
+
+    @classmethod
+    async def _by_id_for_table_name(
+        cls,
+        table_name: str,
+        operation: str,
+        row_id: int,
+        experiment_uuid: Optional[str],
+        db: AsyncSession,
+    ) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Get a by-ID statement and parameters without reflecting a table that is not cached.
+
+        Only the fixed ``id`` and ``experiment_uuid`` columns are involved, so an uncached
+        table with a plain name gets raw SQL in a single round trip. Other names fall back
+        to reflection. Returns None if the table does not exist.
+        """
+        table = cls._table_cache.get(table_name)
+        if table is None and _PLAIN_TABLE_NAME.fullmatch(table_name):
+            quoted = db.get_bind().dialect.identifier_preparer.quote(table_name)
+            sql = _RAW_BY_ID_SQL[operation].format(table=quoted)
+            params = {"_row_id": row_id}
+            # Optionally filter by experiment_uuid for additional security
+            if experiment_uuid:
+                sql += " AND experiment_uuid = :_experiment_uuid"
+                params["_experiment_uuid"] = experiment_uuid
+            return text(sql), params
+
+        if table is None:
+            table = await cls.get_table_reflected(table_name, db)
+            if table is None:
+                return None
+        return cls._by_id(table, operation, row_id, experiment_uuid)
+
+    @classmethod
+    def _build_custom_column(cls, column_name: str, column_type: Any) -> Optional[Column]:
+        """Build a Column for a schema definition entry, or None if it cannot be mapped."""
+        if isinstance(column_type, str):
+            # Default to String if type not recognized
+            return Column(column_name, TYPE_MAPPING.get(column_type.upper(), String(255)))
+
+        if isinstance(column_type, dict):
+            # Handle more complex column definitions
+            col_type = column_type.get("type", "STRING").upper()
+            nullable = column_type.get("nullable", True)
+
+            if col_type in TYPE_MAPPING:
+                return Column(column_name, TYPE_MAPPING[col_type], nullable=nullable)
+
+        return None
 
     @classmethod
     async def create_experiment_table(
-        cls, table_name: str, schema_definition: Dict[str, Any], db: AsyncSession
+        cls,
+        table_name: str,
+        schema_definition: Dict[str, Any],
+        db: AsyncSession,
+        autocommit: bool = False,
     ) -> bool:
-        """Create a dynamic table for experiment data."""
+        """Create a dynamic table for experiment data, committing only if ``autocommit``."""
         try:
-            metadata = MetaData()
+            # Replace any stale definition registered under this name
+            cls._forget_table(table_name)
 
             # Always include these required columns
             columns = [
                 Column("id", Integer, primary_key=True, index=True),
-                Column("experiment_uuid", PostgresUUID(as_uuid=True), nullable=False, index=True),
-                Column("participant_id", String(100), nullable=False, index=True),
+                Column("experiment_uuid", PostgresUUID(as_uuid=True), nullable=False),
+                Column("participant_id", String(100), nullable=False),
                 Column("created_at", DateTime, nullable=False, server_default=text("now()")),
+                # Updates go through reflected tables, so the UPDATE statements stamp this
                 Column("updated_at", DateTime, nullable=False, server_default=text("now()")),
             ]
 
@@ -56,32 +224,34 @@ class ExperimentDataService:
                 ]:
                     continue  # Skip reserved column names
 
-                if isinstance(column_type, str):
-                    column_type = column_type.upper()
-                    if column_type in TYPE_MAPPING:
-                        columns.append(Column(column_name, TYPE_MAPPING[column_type]))
-                    else:
-                        # Default to String if type not recognized
-                        columns.append(Column(column_name, String(255)))
-                elif isinstance(column_type, dict):
-                    # Handle more complex column definitions
-                    col_type = column_type.get("type", "STRING").upper()
-                    nullable = column_type.get("nullable", True)
-
-                    if col_type in TYPE_MAPPING:
-                        columns.append(
-                            Column(column_name, TYPE_MAPPING[col_type], nullable=nullable)
-                        )
+                column = cls._build_custom_column(column_name, column_type)
+                if column is not None:
+                    columns.append(column)
 
             # Create the table
-            Table(table_name, metadata, *columns)
+            table = Table(table_name, _metadata, *columns)
+
+            # Composite indexes serve the filter plus newest-first ordering of get_data_rows
+            # and also cover lookups on their leading column alone
+            Index(
+                _index_name(table_name, "uuid_created"),
+                table.c.experiment_uuid,
+                table.c.created_at.desc(),
+                table.c.id.desc(),
+            )
+            Index(
+                _index_name(table_name, "participant_created"),
+                table.c.participant_id,
+                table.c.created_at.desc(),
+                table.c.id.desc(),
+            )
 
             # Use the provided database session's connection
             connection = await db.connection()
-            await connection.run_sync(metadata.create_all)
+            await connection.run_sync(lambda sync_conn: table.create(sync_conn, checkfirst=True))
 
-            # Commit the transaction to ensure the table is persisted
-            await db.commit()
+            if autocommit:
+                await db.commit()
 
             return True
 
@@ -91,6 +261,9 @@ class ExperimentDataService:
         except Exception as e:
             logger.error(f"Unexpected error creating table {table_name}: {e}")
             return False
+        finally:
+            # checkfirst skips tables that already exist, so reflect the real one on next use
+            cls._forget_table(table_name)
 
     @classmethod
     async def drop_experiment_table(cls, table_name: str, db: AsyncSession) -> bool:
@@ -99,6 +272,7 @@ class ExperimentDataService:
             # Use the provided database session's connection
             await db.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
             await db.commit()
+            cls._forget_table(table_name)
             return True
         except SQLAlchemyError as e:
             logger.error(f"Error dropping table {table_name}: {e}")
@@ -106,16 +280,46 @@ class ExperimentDataService:
 
     @classmethod
     async def get_table_reflected(cls, table_name: str, db: AsyncSession) -> Optional[Table]:
-        """Get a reflected table object for ORM operations."""
+        """Get a reflected table object for ORM operations, reflecting only on first use."""
+        table = cls._table_cache.get(table_name)
+        if table is not None:
+            return table
+
         try:
-            metadata = MetaData()
             # Use the provided database session's connection
             connection = await db.connection()
-            await connection.run_sync(metadata.reflect, only=[table_name])
-            return metadata.tables.get(table_name)
+            await connection.run_sync(_metadata.reflect, only=[table_name])
         except SQLAlchemyError:
             return None
 
+        table = _metadata.tables.get(table_name)
+        if table is not None:
+            cls._table_cache[table_name] = table
+            cls._column_set_cache[table_name] = frozenset(table.c.keys())
+        return table
+
+    @classmethod
+    async def reflect_many(cls, table_names: List[str], db: AsyncSession) -> Dict[str, Table]:
+        """Reflect several tables in one metadata pass and cache them.
+
+        Names that are already cached are skipped and missing tables are ignored.
+        """
+        wanted = {name for name in table_names if name not in cls._table_cache}
+        if wanted:
+            try:
+                connection = await db.connection()
+                await connection.run_sync(_metadata.reflect, only=lambda name, _: name in wanted)
+            except SQLAlchemyError as e:
+                logger.error(f"Error reflecting tables {sorted(wanted)}: {e}")
+
+            for name in wanted:
+                table = _metadata.tables.get(name)
+                if table is not None:
+                    cls._table_cache[name] = table
+                    cls._column_set_cache[name] = frozenset(table.c.keys())
+
+        return {name: cls._table_cache[name] for name in table_names if name in cls._table_cache}
+
     @classmethod
     async def insert_data_row(
         cls,
@@ -124,8 +328,9 @@ class ExperimentDataService:
         participant_id: str,
         data: Dict[str, Any],
         db: AsyncSession,
+        autocommit: bool = False,
     ) -> Optional[int]:
-        """Insert a data row into an experiment table."""
+        """Insert a data row into an experiment table, committing only if ``autocommit``."""
         try:
             table = await cls.get_table_reflected(table_name, db)
             if table is None:
@@ -136,13 +341,8 @@ class ExperimentDataService:
             data["participant_id"] = participant_id
 
             # Check for columns that don't exist in the table
-            missing_columns = []
-            valid_data = {}
-            for key, value in data.items():
-                if key in table.columns:
-                    valid_data[key] = value
-                else:
-                    missing_columns.append(key)
+            column_names = cls._column_names(table)
+            missing_columns = [key for key in data if key not in column_names]
 
             # If there are missing columns, raise an error
             if missing_columns:
@@ -152,9 +352,11 @@ class ExperimentDataService:
                 )
 
             # Use the provided database session
-            result = await db.execute(insert(table).values(**valid_data).returning(table.c.id))
-            await db.commit()
-            return result.scalar()
+            result = await db.execute(cls._statements(table)["insert"], data)
+            row_id = result.scalar()
+            if autocommit:
+                await db.commit()
+            return row_id
 
         except SQLAlchemyError as e:
             logger.error(f"Error inserting data into {table_name}: {e}")
@@ -163,6 +365,131 @@ class ExperimentDataService:
             logger.error(f"Error inserting data into {table_name}: {e}")
             raise
 
+    @classmethod
+    async def insert_data_rows(
+        cls,
+        table_name: str,
+        experiment_uuid: str,
+        rows: List[Dict[str, Any]],
+        db: AsyncSession,
+        autocommit: bool = False,
+    ) -> Optional[List[int]]:
+        """Bulk insert data rows into an experiment table, returning their IDs in order.
+
+        Each row maps column names to values and must include ``participant_id``. Large
+        batches are streamed with PostgreSQL COPY; smaller ones go through ``insert_many``.
+        """
+        return await cls._bulk_insert(
+            table_name, experiment_uuid, rows, db, len(rows) >= COPY_MIN_ROWS, autocommit
+        )
+
+    @classmethod
+    async def insert_many(
+        cls,
+        table_name: str,
+        experiment_uuid: str,
+        rows: List[Dict[str, Any]],
+        db: AsyncSession,
+        autocommit: bool = False,
+    ) -> Optional[List[int]]:
+        """Insert data rows with one batched INSERT ... RETURNING."""
+        return await cls._bulk_insert(table_name, experiment_uuid, rows, db, False, autocommit)
+
+    @classmethod
+    def _bulk_data_columns(cls, table: Table, rows: List[Dict[str, Any]]) -> List[str]:
+        """Get the columns a batch of rows writes, rejecting server-managed or unknown ones."""
+        data_columns = list(dict.fromkeys(key for row in rows for key in row))
+        managed_columns = [key for key in data_columns if key in _SERVER_MANAGED_COLUMNS]
+        if managed_columns:
+            raise ValueError(f"Server-managed columns cannot be set: {managed_columns}")
+        column_names = cls._column_names(table)
+        missing_columns = [key for key in data_columns if key not in column_names]
+        if missing_columns:
+            raise ValueError(
+                f"Unknown columns: {missing_columns}. "
+                "Please update the experiment type schema to include these columns."
+            )
+        return data_columns
+
+    @classmethod
+    async def _bulk_insert(
+        cls,
+        table_name: str,
+        experiment_uuid: str,
+        rows: List[Dict[str, Any]],
+        db: AsyncSession,
+        use_copy: bool,
+        autocommit: bool,
+    ) -> Optional[List[int]]:
+        """Validate a batch of rows once and insert them."""
+        if not rows:
+            return []
+
+        try:
+            table = await cls.get_table_reflected(table_name, db)
+            if table is None:
+                return None
+
+            # Validate the column set once for the whole batch, before choosing COPY or INSERT
+            columns = ["experiment_uuid", *cls._bulk_data_columns(table, rows)]
+            experiment_uuid = UUID(str(experiment_uuid))
+            records = [[experiment_uuid] + [row.get(c) for c in columns[1:]] for row in rows]
+
+            if use_copy:
+                row_ids = await cls._copy_data_rows(table, columns, records, db)
+            else:
+                # insertmanyvalues batches the parameter sets into multi-row INSERT statements
+                values = [dict(zip(columns, record)) for record in records]
+                result = await db.execute(
+                    insert(table).returning(table.c.id, sort_by_parameter_order=True), values
+                )
+                row_ids = list(result.scalars())
+
+            if autocommit:
+                await db.commit()
+            return row_ids
+
+        except (SQLAlchemyError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            logger.error(f"Error bulk inserting data into {table_name}: {e}")
+            # Otherwise the caller owns the transaction, including anything written before
+            if autocommit:
+                await db.rollback()
+            return None
+        except ValueError as e:
+            logger.error(f"Error bulk inserting data into {table_name}: {e}")
+            raise
+
+    @classmethod
+    async def _copy_data_rows(
+        cls, table: Table, columns: List[str], records: List[List[Any]], db: AsyncSession
+    ) -> List[int]:
+        """Stream records into a table with COPY, pre-assigning IDs from its sequence."""
+        result = await db.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"table_name": table.name, "count": len(records)},
+        )
+        row_ids = list(result.scalars())
+
+        # COPY bypasses SQLAlchemy, so apply its bind processing (e.g. JSON encoding) here
+        connection = await db.connection()
+        dialect = connection.dialect
+        processors = [
+            table.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns
+        ]
+        copy_records = [
+            (row_id, *(p(v) if p and v is not None else v for p, v in zip(processors, record)))
+            for row_id, record in zip(row_ids, records)
+        ]
+
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, records=copy_records, columns=["id", *columns]
+        )
+        return row_ids
+
     @classmethod
     def _apply_query_filters(
         cls,
@@ -188,8 +515,9 @@ class ExperimentDataService:
             query = query.where(table.c.created_at <= created_before)
 
         if filters:
+            column_names = cls._column_names(table)
             for key, value in filters.items():
-                if key in table.columns:
+                if key in column_names:
                     query = query.where(table.c[key] == value)
 
         return query
@@ -206,14 +534,27 @@ class ExperimentDataService:
         created_before: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[Dict[str, Any]]:
-        """Get data rows from an experiment table with ORM-style filtering."""
+        columns: Optional[List[str]] = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Get data rows from an experiment table with ORM-style filtering.
+
+        ``columns`` limits the selected columns; unknown names are ignored and an empty
+        selection falls back to every column. Passing the ``created_at`` and ``id`` of the
+        last row of a page as ``after_created_at``/``after_id`` seeks straight to the next
+        page instead of skipping ``offset`` rows.
+        """
         try:
             table = await cls.get_table_reflected(table_name, db)
             if table is None:
                 return []
 
-            query = select(table)
+            selected = []
+            if columns:
+                column_names = cls._column_names(table)
+                selected = [table.c[name] for name in columns if name in column_names]
+            query = select(*selected) if selected else select(table)
             query = cls._apply_query_filters(
                 query,
                 table,
@@ -223,10 +564,18 @@ class ExperimentDataService:
                 created_after,
                 created_before,
             )
-            query = query.order_by(table.c.created_at.desc()).limit(limit).offset(offset)
+            if after_created_at is not None and after_id is not None:
+                query = query.where(
+                    tuple_(table.c.created_at, table.c.id) < tuple_(after_created_at, after_id)
+                )
+            query = (
+                query.order_by(table.c.created_at.desc(), table.c.id.desc())
+                .limit(limit)
+                .offset(offset)
+            )
 
             result = await db.execute(query)
-            return [dict(row._mapping) for row in result]
+            return result.mappings().all()
 
         except SQLAlchemyError as e:
             logger.error(f"Error querying data from {table_name}: {e}")
@@ -238,19 +587,17 @@ class ExperimentDataService:
     ) -> Optional[Dict[str, Any]]:
         """Get a single data row by ID."""
         try:
-            table = await cls.get_table_reflected(table_name, db)
-            if table is None:
+            statement = await cls._by_id_for_table_name(
+                table_name, "select", row_id, experiment_uuid, db
+            )
+            if statement is None:
                 return None
-
-            query = select(table).where(table.c.id == row_id)
-
-            # Optionally filter by experiment_uuid for additional security
-            if experiment_uuid:
-                query = query.where(table.c.experiment_uuid == experiment_uuid)
+            query, params = statement
 
             # Use the provided database session
-            result = await db.execute(query)
-            row = result.first()
+            async with cls._unchecked_table_guard(query, db):
+                result = await db.execute(query, params)
+                row = result.first()
             return dict(row._mapping) if row else None
 
         except SQLAlchemyError as e:
@@ -265,36 +612,33 @@ class ExperimentDataService:
         data: Dict[str, Any],
         db: AsyncSession,
         experiment_uuid: Optional[str] = None,
+        autocommit: bool = False,
     ) -> bool:
-        """Update a data row in an experiment table."""
+        """Update a data row in an experiment table, committing only if ``autocommit``."""
         try:
             table = await cls.get_table_reflected(table_name, db)
             if table is None:
                 return False
 
-            # Don't allow updating id, experiment_uuid, created_at
-            forbidden_columns = ["id", "experiment_uuid", "created_at"]
+            # Don't allow updating id, experiment_uuid, created_at; updated_at is set by the server
+            column_names = cls._column_names(table)
             valid_data = {
-                k: v for k, v in data.items() if k not in forbidden_columns and k in table.columns
+                k: v
+                for k, v in data.items()
+                if k not in _SERVER_MANAGED_COLUMNS and k in column_names
             }
 
             if not valid_data:
                 return False
 
-            # Add updated_at
-            valid_data["updated_at"] = datetime.now(UTC).replace(tzinfo=None)
-
-            query = update(table).where(table.c.id == row_id)
-
-            # Optionally filter by experiment_uuid for additional security
-            if experiment_uuid:
-                query = query.where(table.c.experiment_uuid == experiment_uuid)
-
-            query = query.values(**valid_data)
+            # The SET clause is taken from the column keys in the parameters
+            query, params = cls._by_id(table, "update", row_id, experiment_uuid)
+            params.update(valid_data)
 
             # Use the provided database session
-            result = await db.execute(query)
-            await db.commit()
+            result = await db.execute(query, params)
+            if autocommit:
+                await db.commit()
             return result.rowcount > 0
 
         except SQLAlchemyError as e:
@@ -303,23 +647,27 @@ class ExperimentDataService:
 
     @classmethod
     async def delete_data_row(
-        cls, table_name: str, row_id: int, db: AsyncSession, experiment_uuid: Optional[str] = None
+        cls,
+        table_name: str,
+        row_id: int,
+        db: AsyncSession,
+        experiment_uuid: Optional[str] = None,
+        autocommit: bool = False,
     ) -> bool:
-        """Delete a data row from an experiment table."""
+        """Delete a data row from an experiment table, committing only if ``autocommit``."""
         try:
-            table = await cls.get_table_reflected(table_name, db)
-            if table is None:
+            statement = await cls._by_id_for_table_name(
+                table_name, "delete", row_id, experiment_uuid, db
+            )
+            if statement is None:
                 return False
-
-            query = delete(table).where(table.c.id == row_id)
-
-            # Optionally filter by experiment_uuid for additional security
-            if experiment_uuid:
-                query = query.where(table.c.experiment_uuid == experiment_uuid)
+            query, params = statement
 
             # Use the provided database session
-            result = await db.execute(query)
-            await db.commit()
+            async with cls._unchecked_table_guard(query, db):
+                result = await db.execute(query, params)
+            if autocommit:
+                await db.commit()
             return result.rowcount > 0
 
         except SQLAlchemyError as e:
@@ -349,6 +697,18 @@ class ExperimentDataService:
         except SQLAlchemyError:
             return []
 
+    @classmethod
+    async def _estimate_row_count(cls, table_name: str, db: AsyncSession) -> Optional[int]:
+        """Get the planner's row estimate for a table, or None if the table does not exist.
+
+        Tables that have never been vacuumed or analyzed report -1.
+        """
+        result = await db.execute(
+            text("SELECT reltuples::BIGINT FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        )
+        return result.scalar()
+
     @classmethod
     async def count_data_rows(
         cls,
@@ -358,8 +718,19 @@ class ExperimentDataService:
         participant_id: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
     ) -> int:
-        """Count data rows in an experiment table."""
+        """Count data rows in an experiment table.
+
+        Unfiltered counts on large tables return the planner's ``pg_class.reltuples``
+        estimate instead of scanning the whole table.
+        """
         try:
+            if experiment_uuid is None and participant_id is None and not filters:
+                estimate = await cls._estimate_row_count(table_name, db)
+                if estimate is None:
+                    return 0
+                if estimate >= ESTIMATED_COUNT_MIN_ROWS:
+                    return estimate
+
             table = await cls.get_table_reflected(table_name, db)
             if table is None:
                 return 0
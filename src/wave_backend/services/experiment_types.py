@@ -1,8 +1,9 @@
 """Service layer for experiment type operations."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wave_backend.models.models import ExperimentType
@@ -17,36 +18,37 @@ class ExperimentTypeService:
     async def create_experiment_type(
         db: AsyncSession, experiment_type: ExperimentTypeCreate
     ) -> ExperimentType:
-        """Create a new experiment type and its corresponding data table."""
+        """Create a new experiment type and its corresponding data table in one transaction."""
         db_experiment_type = ExperimentType(**experiment_type.model_dump())
         db.add(db_experiment_type)
-        await db.commit()
-        await db.refresh(db_experiment_type)
-
-        # Create the dynamic table for this experiment type
+        try:
+            await db.flush()
+        except SQLAlchemyError:
+            await db.rollback()
+            raise
+
+        # Create the dynamic table for this experiment type. PostgreSQL DDL is transactional,
+        # so the type row and the table are committed or rolled back together.
         table_created = await ExperimentDataService.create_experiment_table(
             db_experiment_type.table_name, db_experiment_type.schema_definition, db
         )
 
         if not table_created:
-            # If table creation fails, rollback the experiment type creation
-            await db.delete(db_experiment_type)
-            await db.commit()
+            await db.rollback()
             raise RuntimeError(
-                f"Failed to create experiment data table: {db_experiment_type.table_name}"
+                f"Failed to create experiment data table: {experiment_type.table_name}"
             )
 
+        await db.commit()
+        await db.refresh(db_experiment_type)
         return db_experiment_type
 
     @staticmethod
     async def get_experiment_type(
         db: AsyncSession, experiment_type_id: int
     ) -> Optional[ExperimentType]:
-        """Get an experiment type by ID."""
-        result = await db.execute(
-            select(ExperimentType).where(ExperimentType.id == experiment_type_id)
-        )
-        return result.scalar_one_or_none()
+        """Get an experiment type by ID, served from the identity map when already loaded."""
+        return await db.get(ExperimentType, experiment_type_id)
 
     @staticmethod
     async def get_experiment_type_by_name(db: AsyncSession, name: str) -> Optional[ExperimentType]:
@@ -54,6 +56,16 @@ class ExperimentTypeService:
         result = await db.execute(select(ExperimentType).where(ExperimentType.name == name))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_experiment_types_by_names(
+        db: AsyncSession, names: List[str]
+    ) -> Dict[str, ExperimentType]:
+        """Get experiment types for several names in one query, keyed by name."""
+        if not names:
+            return {}
+        result = await db.execute(select(ExperimentType).where(ExperimentType.name.in_(names)))
+        return {experiment_type.name: experiment_type for experiment_type in result.scalars()}
+
     @staticmethod
     async def get_experiment_types(
         db: AsyncSession, skip: int = 0, limit: int = 100
@@ -66,17 +78,19 @@ class ExperimentTypeService:
     async def update_experiment_type(
         db: AsyncSession, experiment_type_id: int, experiment_type_update: ExperimentTypeUpdate
     ) -> Optional[ExperimentType]:
-        """Update an experiment type."""
-        db_experiment_type = await ExperimentTypeService.get_experiment_type(db, experiment_type_id)
-        if not db_experiment_type:
-            return None
-
+        """Update an experiment type with a single UPDATE ... RETURNING."""
         update_data = experiment_type_update.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_experiment_type, field, value)
+        if not update_data:
+            return await ExperimentTypeService.get_experiment_type(db, experiment_type_id)
 
+        result = await db.execute(
+            update(ExperimentType)
+            .where(ExperimentType.id == experiment_type_id)
+            .values(**update_data)
+            .returning(ExperimentType)
+        )
+        db_experiment_type = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(db_experiment_type)
         return db_experiment_type
 
     @staticmethod
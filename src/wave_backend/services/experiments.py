@@ -1,13 +1,13 @@
 """Service layer for experiment operations."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import inspect, select
+from sqlalchemy import and_, delete, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from wave_backend.models.models import Experiment, Tag
+from wave_backend.models.models import Experiment, ExperimentType, Tag
 from wave_backend.schemas.schemas import (
     ColumnTypeInfo,
     ExperimentColumnsResponse,
@@ -15,41 +15,77 @@ from wave_backend.schemas.schemas import (
     ExperimentUpdate,
 )
 
+# Known columns of the experiments table, used when reflection fails
+_BASE_COLUMNS_FALLBACK: Tuple[ColumnTypeInfo, ...] = (
+    ColumnTypeInfo(column_name="uuid", column_type="UUID", is_nullable=False),
+    ColumnTypeInfo(column_name="experiment_type_id", column_type="INTEGER", is_nullable=False),
+    ColumnTypeInfo(column_name="participant_id", column_type="VARCHAR(100)", is_nullable=False),
+    ColumnTypeInfo(column_name="description", column_type="TEXT", is_nullable=False),
+    ColumnTypeInfo(column_name="tags", column_type="VARCHAR[]", is_nullable=True),
+    ColumnTypeInfo(column_name="additional_data", column_type="JSON", is_nullable=True),
+    ColumnTypeInfo(
+        column_name="created_at",
+        column_type="TIMESTAMP WITH TIME ZONE",
+        is_nullable=True,
+    ),
+    ColumnTypeInfo(
+        column_name="updated_at",
+        column_type="TIMESTAMP WITH TIME ZONE",
+        is_nullable=True,
+    ),
+)
+
 
 class ExperimentService:
     """Service for experiment CRUD operations."""
 
+    # Reflected columns of the experiments table, keyed by engine. The table only changes
+    # through migrations, so it is reflected once per process.
+    _base_columns_cache: Dict[Any, Tuple[ColumnTypeInfo, ...]] = {}
+
+    @staticmethod
+    async def _validate_tags_exist(db: AsyncSession, tag_names: List[str]) -> None:
+        """Raise ValueError if any of the given tags does not exist, using a single query."""
+        result = await db.execute(select(Tag.name).where(Tag.name.in_(tag_names)))
+        existing = set(result.scalars().all())
+        # Report the first missing tag in request order
+        for tag_name in tag_names:
+            if tag_name not in existing:
+                raise ValueError(f"Tag '{tag_name}' does not exist. Please create the tag first.")
+
     @staticmethod
     async def create_experiment(db: AsyncSession, experiment: ExperimentCreate) -> Experiment:
         """Create a new experiment."""
         # Validate that all tags exist
         if experiment.tags:
-            for tag_name in experiment.tags:
-                result = await db.execute(select(Tag).where(Tag.name == tag_name))
-                if not result.scalar_one_or_none():
-                    raise ValueError(
-                        f"Tag '{tag_name}' does not exist. Please create the tag first."
-                    )
+            await ExperimentService._validate_tags_exist(db, experiment.tags)
 
         db_experiment = Experiment(**experiment.model_dump())
         db.add(db_experiment)
         await db.commit()
         await db.refresh(db_experiment)
 
-        # Load the experiment_type relationship to avoid lazy loading issues during serialization
-        result = await db.execute(
-            select(Experiment)
-            .options(selectinload(Experiment.experiment_type))
-            .where(Experiment.uuid == db_experiment.uuid)
-        )
-        return result.scalar_one()
+        # Load the experiment_type relationship to avoid lazy loading issues during serialization.
+        # This is a many-to-one, so it is served from the identity map when already loaded.
+        await db.refresh(db_experiment, attribute_names=["experiment_type"])
+        return db_experiment
 
     @staticmethod
     async def get_experiment(db: AsyncSession, experiment_uuid: UUID) -> Optional[Experiment]:
         """Get an experiment by UUID."""
         result = await db.execute(
             select(Experiment)
-            .options(selectinload(Experiment.experiment_type))
+            .options(joinedload(Experiment.experiment_type, innerjoin=True))
+            .where(Experiment.uuid == experiment_uuid)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_experiment_table_name(db: AsyncSession, experiment_uuid: UUID) -> Optional[str]:
+        """Get the data table name of an experiment's type without loading the experiment."""
+        result = await db.execute(
+            select(ExperimentType.table_name)
+            .join(Experiment, Experiment.experiment_type_id == ExperimentType.id)
             .where(Experiment.uuid == experiment_uuid)
         )
         return result.scalar_one_or_none()
@@ -63,14 +99,17 @@ class ExperimentService:
         tags: Optional[List[str]] = None,
     ) -> List[Experiment]:
         """Get experiments with optional filtering."""
-        query = select(Experiment).options(selectinload(Experiment.experiment_type))
+        query = select(Experiment).options(joinedload(Experiment.experiment_type, innerjoin=True))
 
+        conditions = []
         if experiment_type_id:
-            query = query.where(Experiment.experiment_type_id == experiment_type_id)
+            conditions.append(Experiment.experiment_type_id == experiment_type_id)
 
         if tags:
-            for tag in tags:
-                query = query.where(Experiment.tags.any(tag))
+            conditions.append(Experiment.tags.contains(tags))
+
+        if conditions:
+            query = query.where(and_(*conditions))
 
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
@@ -80,105 +119,104 @@ class ExperimentService:
     async def update_experiment(
         db: AsyncSession, experiment_uuid: UUID, experiment_update: ExperimentUpdate
     ) -> Optional[Experiment]:
-        """Update an experiment."""
-        db_experiment = await ExperimentService.get_experiment(db, experiment_uuid)
-        if not db_experiment:
-            return None
-
-        # Validate that all tags exist if tags are being updated
+        """Update an experiment with a single UPDATE ... RETURNING."""
         update_data = experiment_update.model_dump(exclude_unset=True)
-        if "tags" in update_data and update_data["tags"]:
-            for tag_name in update_data["tags"]:
-                result = await db.execute(select(Tag).where(Tag.name == tag_name))
-                if not result.scalar_one_or_none():
-                    raise ValueError(
-                        f"Tag '{tag_name}' does not exist. Please create the tag first."
-                    )
+        if not update_data:
+            return await ExperimentService.get_experiment(db, experiment_uuid)
 
-        for field, value in update_data.items():
-            setattr(db_experiment, field, value)
+        result = await db.execute(
+            update(Experiment)
+            .where(Experiment.uuid == experiment_uuid)
+            .values(**update_data)
+            .returning(Experiment)
+        )
+        db_experiment = result.scalar_one_or_none()
+        if db_experiment is None:
+            return None
 
+        # Validate that all tags exist if tags are being updated. This runs after the UPDATE so
+        # a missing experiment is reported as such; the uncommitted UPDATE is rolled back.
+        if "tags" in update_data and update_data["tags"]:
+            try:
+                await ExperimentService._validate_tags_exist(db, update_data["tags"])
+            except ValueError:
+                await db.rollback()
+                raise
         await db.commit()
-        await db.refresh(db_experiment)
 
-        # Load the experiment_type relationship to avoid lazy loading issues during serialization
-        result = await db.execute(
-            select(Experiment)
-            .options(selectinload(Experiment.experiment_type))
-            .where(Experiment.uuid == db_experiment.uuid)
-        )
-        return result.scalar_one()
+        # Load the experiment_type relationship to avoid lazy loading issues during serialization.
+        # This is a many-to-one, so it is served from the identity map when already loaded.
+        await db.refresh(db_experiment, attribute_names=["experiment_type"])
+        return db_experiment
 
     @staticmethod
     async def delete_experiment(db: AsyncSession, experiment_uuid: UUID) -> bool:
-        """Delete an experiment."""
-        db_experiment = await ExperimentService.get_experiment(db, experiment_uuid)
-        if not db_experiment:
+        """Delete an experiment with a single DELETE ... RETURNING."""
+        result = await db.execute(
+            delete(Experiment).where(Experiment.uuid == experiment_uuid).returning(Experiment.uuid)
+        )
+        if result.scalar_one_or_none() is None:
             return False
 
-        await db.delete(db_experiment)
         await db.commit()
         return True
 
+    @staticmethod
+    async def get_base_columns(db: AsyncSession) -> Tuple[ColumnTypeInfo, ...]:
+        """Get the reflected columns of the experiments table, reflecting once per engine."""
+        # A session bound to a connection reports that connection; key on its engine
+        engine = db.get_bind().engine
+        cached = ExperimentService._base_columns_cache.get(engine)
+        if cached is None:
+
+            def get_columns_sync(sync_conn):
+                inspector = inspect(sync_conn)
+                return inspector.get_columns("experiments")
+
+            columns_info = await db.run_sync(get_columns_sync)
+            cached = tuple(
+                ColumnTypeInfo(
+                    column_name=col["name"],
+                    column_type=str(col["type"]),
+                    is_nullable=col["nullable"],
+                    default_value=col["default"],
+                )
+                for col in columns_info
+            )
+            ExperimentService._base_columns_cache[engine] = cached
+        return cached
+
     @staticmethod
     async def get_experiment_columns(
         db: AsyncSession,
         experiment_uuid: Optional[UUID] = None,
         experiment_type_name: Optional[str] = None,
     ) -> Optional[ExperimentColumnsResponse]:
-        """Get column information for an experiment or experiment type."""
-
-        if experiment_uuid:
-            experiment = await ExperimentService.get_experiment(db, experiment_uuid)
-            if not experiment:
+        """Get column information for an experiment or experiment type.
+
+        When both are given, ``experiment_type_name`` is used as is and the experiment is
+        not looked up.
+        """
+        # Only the type name is needed, so skip loading the experiment when it is given
+        if experiment_uuid and not experiment_type_name:
+            result = await db.execute(
+                select(ExperimentType.name)
+                .join(Experiment, Experiment.experiment_type_id == ExperimentType.id)
+                .where(Experiment.uuid == experiment_uuid)
+            )
+            experiment_type_name = result.scalar_one_or_none()
+            if not experiment_type_name:
                 return None
-            experiment_type_name = experiment.experiment_type.name
 
         if not experiment_type_name:
             return None
 
         # Get the table schema from the database
-        base_columns = []
         try:
-
-            def get_columns_sync(sync_conn):
-                inspector = inspect(sync_conn)
-                return inspector.get_columns("experiments")
-
-            columns_info = await db.run_sync(get_columns_sync)
-            for col in columns_info:
-                base_columns.append(
-                    ColumnTypeInfo(
-                        column_name=col["name"],
-                        column_type=str(col["type"]),
-                        is_nullable=col["nullable"],
-                        default_value=col["default"],
-                    )
-                )
+            base_columns = list(await ExperimentService.get_base_columns(db))
         except Exception:
             # Fallback to known base columns
-            base_columns = [
-                ColumnTypeInfo(column_name="uuid", column_type="UUID", is_nullable=False),
-                ColumnTypeInfo(
-                    column_name="experiment_type_id", column_type="INTEGER", is_nullable=False
-                ),
-                ColumnTypeInfo(
-                    column_name="participant_id", column_type="VARCHAR(100)", is_nullable=False
-                ),
-                ColumnTypeInfo(column_name="description", column_type="TEXT", is_nullable=False),
-                ColumnTypeInfo(column_name="tags", column_type="VARCHAR[]", is_nullable=True),
-                ColumnTypeInfo(column_name="additional_data", column_type="JSON", is_nullable=True),
-                ColumnTypeInfo(
-                    column_name="created_at",
-                    column_type="TIMESTAMP WITH TIME ZONE",
-                    is_nullable=True,
-                ),
-                ColumnTypeInfo(
-                    column_name="updated_at",
-                    column_type="TIMESTAMP WITH TIME ZONE",
-                    is_nullable=True,
-                ),
-            ]
+            base_columns = list(_BASE_COLUMNS_FALLBACK)
 
         return ExperimentColumnsResponse(
             experiment_uuid=experiment_uuid,
@@ -1,11 +1,23 @@
 """Service layer for advanced search and filtering operations."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import and_, func, or_, select
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    StatementLambdaElement,
+    Table,
+    and_,
+    func,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from wave_backend.models.models import Experiment, ExperimentType, Tag
 from wave_backend.utils.logging import get_logger
@@ -27,28 +39,83 @@ class SearchService:
         created_before: Optional[datetime] = None,
     ) -> List[Experiment]:
         """Search experiments by tags with date filtering."""
-        query = select(Experiment).options(selectinload(Experiment.experiment_type))
+        query = SearchService._experiments_by_tags_statement(
+            tags, match_all, skip, limit, created_after, created_before
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    @staticmethod
+    async def search_experiment_summaries_by_tags(
+        db: AsyncSession,
+        tags: List[str],
+        match_all: bool = True,
+        skip: int = 0,
+        limit: int = 100,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> Sequence[Row]:
+        """Search experiments by tags, returning plain rows instead of ORM objects.
+
+        Each row has ``uuid``, ``description``, ``tags``, ``created_at``,
+        ``experiment_type_name`` and ``table_name``, read with a single joined query.
+        """
+        query = SearchService._experiments_by_tags_statement(
+            tags, match_all, skip, limit, created_after, created_before, summary=True
+        )
+        result = await db.execute(query)
+        return result.all()
+
+    @staticmethod
+    def _experiments_by_tags_statement(
+        tags: List[str],
+        match_all: bool,
+        skip: int,
+        limit: int,
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+        summary: bool = False,
+    ) -> StatementLambdaElement:
+        """Build the tag search statement as a lambda statement.
+
+        Each lambda is keyed on its code location, so repeated searches reuse the cached
+        statement and compiled SQL, and only the bound values are extracted per call.
+        """
+        if summary:
+            query = lambda_stmt(
+                lambda: select(
+                    Experiment.uuid,
+                    Experiment.description,
+                    Experiment.tags,
+                    Experiment.created_at,
+                    ExperimentType.name.label("experiment_type_name"),
+                    ExperimentType.table_name,
+                ).join(ExperimentType, Experiment.experiment_type_id == ExperimentType.id)
+            )
+        else:
+            query = lambda_stmt(
+                lambda: select(Experiment).options(
+                    joinedload(Experiment.experiment_type, innerjoin=True)
+                )
+            )
 
         # Tag filtering
         if tags:
             if match_all:
                 # Must contain ALL specified tags
-                for tag in tags:
-                    query = query.where(Experiment.tags.any(tag))
+                query += lambda s: s.where(Experiment.tags.contains(tags))
             else:
                 # Must contain ANY of the specified tags
-                tag_conditions = [Experiment.tags.any(tag) for tag in tags]
-                query = query.where(or_(*tag_conditions))
+                query += lambda s: s.where(Experiment.tags.overlap(tags))
 
         # Date range filtering
         if created_after:
-            query = query.where(Experiment.created_at >= created_after)
+            query += lambda s: s.where(Experiment.created_at >= created_after)
         if created_before:
-            query = query.where(Experiment.created_at <= created_before)
+            query += lambda s: s.where(Experiment.created_at <= created_before)
 
-        query = query.order_by(Experiment.created_at.desc()).offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        query += lambda s: s.order_by(Experiment.created_at.desc()).offset(skip).limit(limit)
+        return query
 
     @staticmethod
     async def search_experiment_types_by_description(
@@ -62,21 +129,27 @@ class SearchService:
         """Search experiment types by description text."""
         query = select(ExperimentType)
 
+        conditions = []
+
         # Text search (case-insensitive)
         if search_text:
-            search_pattern = f"%{search_text.lower()}%"
-            query = query.where(
+            search_pattern = f"%{search_text}%"
+            conditions.append(
                 or_(
-                    func.lower(ExperimentType.description).like(search_pattern),
-                    func.lower(ExperimentType.name).like(search_pattern),
+                    ExperimentType.description.ilike(search_pattern),
+                    ExperimentType.name.ilike(search_pattern),
                 )
             )
 
         # Date range filtering
         if created_after:
-            query = query.where(ExperimentType.created_at >= created_after)
+            conditions.append(ExperimentType.created_at >= created_after)
         if created_before:
-            query = query.where(ExperimentType.created_at <= created_before)
+            conditions.append(ExperimentType.created_at <= created_before)
+
+        # Apply all conditions
+        if conditions:
+            query = query.where(and_(*conditions))
 
         query = query.order_by(ExperimentType.created_at.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
@@ -94,21 +167,27 @@ class SearchService:
         """Search tags by name or description."""
         query = select(Tag)
 
+        conditions = []
+
         # Text search (case-insensitive)
         if search_text:
-            search_pattern = f"%{search_text.lower()}%"
-            query = query.where(
+            search_pattern = f"%{search_text}%"
+            conditions.append(
                 or_(
-                    func.lower(Tag.name).like(search_pattern),
-                    func.lower(Tag.description).like(search_pattern),
+                    Tag.name.ilike(search_pattern),
+                    Tag.description.ilike(search_pattern),
                 )
             )
 
         # Date range filtering
         if created_after:
-            query = query.where(Tag.created_at >= created_after)
+            conditions.append(Tag.created_at >= created_after)
         if created_before:
-            query = query.where(Tag.created_at <= created_before)
+            conditions.append(Tag.created_at <= created_before)
+
+        # Apply all conditions
+        if conditions:
+            query = query.where(and_(*conditions))
 
         query = query.order_by(Tag.created_at.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
@@ -125,21 +204,24 @@ class SearchService:
         created_before: Optional[datetime] = None,
     ) -> List[Experiment]:
         """Search experiment descriptions within a specific experiment type."""
-        query = select(Experiment).options(selectinload(Experiment.experiment_type))
+        query = select(Experiment).options(joinedload(Experiment.experiment_type, innerjoin=True))
 
         # Filter by experiment type
-        query = query.where(Experiment.experiment_type_id == experiment_type_id)
+        conditions = [Experiment.experiment_type_id == experiment_type_id]
 
         # Text search in description
         if search_text:
-            search_pattern = f"%{search_text.lower()}%"
-            query = query.where(func.lower(Experiment.description).like(search_pattern))
+            search_pattern = f"%{search_text}%"
+            conditions.append(Experiment.description.ilike(search_pattern))
 
         # Date range filtering
         if created_after:
-            query = query.where(Experiment.created_at >= created_after)
+            conditions.append(Experiment.created_at >= created_after)
         if created_before:
-            query = query.where(Experiment.created_at <= created_before)
+            conditions.append(Experiment.created_at <= created_before)
+
+        # Apply all conditions
+        query = query.where(and_(*conditions))
 
         query = query.order_by(Experiment.created_at.desc()).offset(skip).limit(limit)
         result = await db.execute(query)
@@ -158,14 +240,14 @@ class SearchService:
         limit: int = 100,
     ) -> List[Experiment]:
         """Advanced search combining multiple criteria."""
-        query = select(Experiment).options(selectinload(Experiment.experiment_type))
+        query = select(Experiment).options(joinedload(Experiment.experiment_type, innerjoin=True))
 
         conditions = []
 
         # Text search in description
         if search_text:
-            search_pattern = f"%{search_text.lower()}%"
-            conditions.append(func.lower(Experiment.description).like(search_pattern))
+            search_pattern = f"%{search_text}%"
+            conditions.append(Experiment.description.ilike(search_pattern))
 
         # Experiment type filtering
         if experiment_type_id:
@@ -175,12 +257,10 @@ class SearchService:
         if tags:
             if match_all_tags:
                 # Must contain ALL specified tags
-                for tag in tags:
-                    conditions.append(Experiment.tags.any(tag))
+                conditions.append(Experiment.tags.contains(tags))
             else:
                 # Must contain ANY of the specified tags
-                tag_conditions = [Experiment.tags.any(tag) for tag in tags]
-                conditions.append(or_(*tag_conditions))
+                conditions.append(Experiment.tags.overlap(tags))
 
         # Date range filtering
         if created_after:
@@ -210,7 +290,7 @@ class SearchService:
         from wave_backend.services.experiment_data import ExperimentDataService
 
         # First get experiments matching the tags
-        experiments = await SearchService.search_experiments_by_tags(
+        experiments = await SearchService.search_experiment_summaries_by_tags(
             db,
             tags,
             match_all,
@@ -220,46 +300,134 @@ class SearchService:
             created_before,  # Get all matching experiments
         )
 
-        # Collect data from all matching experiments
-        all_data = []
-        experiment_info = {}
-
+        # Group matching experiments by the data table their type writes to
+        uuids_by_table: Dict[str, List[str]] = {}
         for experiment in experiments:
-            # Get data for this experiment
-            experiment_data = await ExperimentDataService.get_data_rows(
-                experiment.experiment_type.table_name,
-                db,
-                experiment_uuid=str(experiment.uuid),
-                created_after=created_after,
-                created_before=created_before,
-                limit=1000,  # Get all data for each experiment
-                offset=0,
+            uuids_by_table.setdefault(experiment.table_name, []).append(str(experiment.uuid))
+        tables = await ExperimentDataService.reflect_many(list(uuids_by_table), db)
+        conditions = {
+            table_name: SearchService._data_row_conditions(
+                table, uuids_by_table[table_name], created_after, created_before
             )
+            for table_name, table in tables.items()
+        }
 
-            # Add experiment metadata to each data row
-            for row in experiment_data:
-                row["experiment_metadata"] = {
-                    "experiment_uuid": str(experiment.uuid),
-                    "experiment_description": experiment.description,
-                    "experiment_type_name": experiment.experiment_type.name,
-                    "experiment_tags": experiment.tags,
-                }
-                all_data.append(row)
-
-            experiment_info[str(experiment.uuid)] = {
+        counts = await SearchService._count_data_rows_by_experiment(db, tables, conditions)
+        page = await SearchService._page_data_rows(db, tables, conditions, skip, limit)
+
+        experiment_metadata = {}
+        experiment_info = {}
+        for experiment in experiments:
+            experiment_uuid = str(experiment.uuid)
+            experiment_metadata[experiment_uuid] = {
+                "experiment_uuid": experiment_uuid,
+                "experiment_description": experiment.description,
+                "experiment_type_name": experiment.experiment_type_name,
+                "experiment_tags": experiment.tags,
+            }
+            experiment_info[experiment_uuid] = {
                 "description": experiment.description,
-                "type_name": experiment.experiment_type.name,
+                "type_name": experiment.experiment_type_name,
                 "tags": experiment.tags,
-                "data_count": len(experiment_data),
+                "data_count": counts.get(experiment_uuid, 0),
             }
 
-        # Apply pagination to the combined results
-        paginated_data = all_data[skip : skip + limit]  # noqa: E203
+        # Add experiment metadata to each data row
+        paginated_data = [
+            {**row, "experiment_metadata": experiment_metadata[str(row["experiment_uuid"])]}
+            for row in page
+        ]
+        total_rows = sum(counts.values())
 
         return {
             "data": paginated_data,
-            "total_rows": len(all_data),
+            "total_rows": total_rows,
             "total_experiments": len(experiments),
             "experiment_info": experiment_info,
-            "pagination": {"skip": skip, "limit": limit, "total": len(all_data)},
+            "pagination": {"skip": skip, "limit": limit, "total": total_rows},
         }
+
+    @staticmethod
+    def _data_row_conditions(
+        table: Table,
+        experiment_uuids: List[str],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+    ) -> List[ColumnElement[bool]]:
+        """Build the WHERE conditions selecting an experiment data table's matching rows."""
+        conditions = [table.c.experiment_uuid.in_(experiment_uuids)]
+        if created_after:
+            conditions.append(table.c.created_at >= created_after)
+        if created_before:
+            conditions.append(table.c.created_at <= created_before)
+        return conditions
+
+    @staticmethod
+    async def _count_data_rows_by_experiment(
+        db: AsyncSession,
+        tables: Dict[str, Table],
+        conditions: Dict[str, List[ColumnElement[bool]]],
+    ) -> Dict[str, int]:
+        """Count matching data rows per experiment across all tables in one query."""
+        if not tables:
+            return {}
+
+        counts = union_all(
+            *(
+                select(table.c.experiment_uuid, func.count().label("row_count"))
+                .where(*conditions[table_name])
+                .group_by(table.c.experiment_uuid)
+                for table_name, table in tables.items()
+            )
+        )
+        result = await db.execute(counts)
+        return {str(experiment_uuid): row_count for experiment_uuid, row_count in result}
+
+    @staticmethod
+    async def _page_data_rows(
+        db: AsyncSession,
+        tables: Dict[str, Table],
+        conditions: Dict[str, List[ColumnElement[bool]]],
+        skip: int,
+        limit: int,
+    ) -> List[Mapping[str, Any]]:
+        """Fetch one page of matching data rows, newest first, across all tables.
+
+        The page is chosen in SQL over the rows' keys only, then the full rows are loaded
+        with one query per table that appears on the page.
+        """
+        if not tables:
+            return []
+
+        keys = union_all(
+            *(
+                select(
+                    literal(table_name).label("table_name"),
+                    table.c.id,
+                    table.c.created_at,
+                ).where(*conditions[table_name])
+                for table_name, table in tables.items()
+            )
+        ).subquery()
+        result = await db.execute(
+            select(keys.c.table_name, keys.c.id)
+            .order_by(keys.c.created_at.desc(), keys.c.id.desc(), keys.c.table_name)
+            .offset(skip)
+            .limit(limit)
+        )
+        page_keys = [tuple(key) for key in result]
+
+        ids_by_table: Dict[str, List[int]] = {}
+        for table_name, row_id in page_keys:
+            ids_by_table.setdefault(table_name, []).append(row_id)
+
+        # Loaded one table at a time on the request's session, so a page never holds more
+        # than its one pooled connection and reads in the same transaction as its keys
+        rows = {}
+        for table_name, row_ids in ids_by_table.items():
+            table = tables[table_name]
+            result = await db.execute(select(table).where(table.c.id.in_(row_ids)))
+            for row in result.mappings():
+                rows[table_name, row["id"]] = row
+
+        return [rows[key] for key in page_keys if key in rows]
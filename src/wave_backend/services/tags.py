@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from wave_backend.models.models import Tag
@@ -33,6 +33,17 @@ class TagService:
         result = await db.execute(select(Tag).where(Tag.name == name))
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def tag_name_exists(
+        db: AsyncSession, name: str, exclude_id: Optional[int] = None
+    ) -> bool:
+        """Check whether a tag name is taken, optionally ignoring the tag with ``exclude_id``."""
+        condition = exists().where(Tag.name == name)
+        if exclude_id is not None:
+            condition = condition.where(Tag.id != exclude_id)
+        result = await db.execute(select(condition))
+        return result.scalar()
+
     @staticmethod
     async def get_tags(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Tag]:
         """Get tags with pagination."""
@@ -10,6 +10,8 @@ from dotenv import load_dotenv
 
 from wave_backend.utils.constants import ROOT_DIR
 
+_DOTENV_PATH = os.fspath(ROOT_DIR / ".env")
+
 
 def _setup_logging(
     default_path="logging_config.ini",
@@ -38,14 +40,14 @@ def _setup_logging(
 
     # Use absolute path for repository root
     if not os.path.isabs(path):
-        path = ROOT_DIR / path
+        path = os.path.join(ROOT_DIR, path)
 
     # Get log level from environment variable if available
     log_level_name = os.getenv(env_key_level)
     if log_level_name:
-        try:
-            log_level = getattr(logging, log_level_name.upper().strip())
-        except AttributeError:
+        # Unknown names come back as the string "Level <name>" rather than an int
+        log_level = logging.getLevelName(log_level_name.upper().strip())
+        if isinstance(log_level, str):
             # Fall back to default if invalid level name
             log_level = default_level
             print(f"WARNING: Invalid log level '{log_level_name}', using default.")
@@ -95,6 +97,9 @@ def get_logger(name: str) -> logging.Logger:
 
 
 # Initialize logging configuration when module is imported
-# This happens only once when the module is first imported
-load_dotenv(str(ROOT_DIR / ".env"))
+# This happens only once when the module is first imported. Worker processes inherit the
+# environment of the process that already read .env, so they skip reading it again.
+if not os.environ.get("WAVE_DOTENV_LOADED"):
+    load_dotenv(_DOTENV_PATH)
+    os.environ["WAVE_DOTENV_LOADED"] = "1"
 _setup_logging()
@@ -38,7 +38,9 @@ This system uses standard semantic versioning (semver) compatibility rules:
 3. **Major updates** (1.0.0 → 2.0.0): Breaking changes, update both client and API
 """
 
+import logging
 import re
+from functools import lru_cache
 from typing import Optional
 
 from wave_backend.utils.logging import get_logger
@@ -48,11 +50,18 @@ logger = get_logger(__name__)
 # Current API version - update this when making changes
 API_VERSION = "1.0.0"
 
+# Semantic version with optional pre-release and build metadata
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-[a-zA-Z0-9.-]+)?(?:\+[a-zA-Z0-9.-]+)?$")
 
+
+@lru_cache(maxsize=256)
 def parse_version(version: str) -> tuple[int, int, int]:
     """
     Parse semantic version string into tuple.
 
+    Results are memoized, since the same few client versions arrive on every request.
+    The cache is bounded because the client version comes from a request header.
+
     Args:
         version: Version string like "1.2.3"
 
@@ -68,9 +77,13 @@ def parse_version(version: str) -> tuple[int, int, int]:
     # Remove 'v' prefix if present
     clean_version = version.lstrip("v")
 
-    # Match semantic version pattern
-    pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-[a-zA-Z0-9.-]+)?(?:\+[a-zA-Z0-9.-]+)?$"
-    match = re.match(pattern, clean_version)
+    # Fast path for plain release versions like "1.2.3"
+    parts = clean_version.split(".")
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return int(parts[0]), int(parts[1]), int(parts[2])
+
+    # Match semantic version pattern (pre-release and build metadata)
+    match = _SEMVER_RE.match(clean_version)
 
     if not match:
         raise ValueError(f"Invalid semantic version format: {version}")
@@ -78,6 +91,34 @@ def parse_version(version: str) -> tuple[int, int, int]:
     return int(match.group(1)), int(match.group(2)), int(match.group(3))
 
 
+# Parsed once, since API_VERSION is the api_version of every request-time check
+_API_VERSION_PARSED = parse_version(API_VERSION)
+
+
+def _classify(
+    client_version: str, api_version: str
+) -> tuple[bool, Optional[tuple[int, int, int]], Optional[tuple[int, int, int]]]:
+    """Check compatibility and return the parsed versions alongside the result.
+
+    The parsed tuples are None when either version is malformed, in which case the
+    versions are reported as incompatible.
+    """
+    # Clients on the server's own release skip parsing; API_VERSION is known to be valid
+    if client_version == api_version == API_VERSION:
+        return True, _API_VERSION_PARSED, _API_VERSION_PARSED
+
+    try:
+        # Parse both versions
+        client = parse_version(client_version)
+        api = _API_VERSION_PARSED if api_version == API_VERSION else parse_version(api_version)
+    except ValueError as e:
+        logger.warning(f"Version parsing error: {e}")
+        return False, None, None
+
+    # Same major version = compatible (following semantic versioning)
+    return client[0] == api[0], client, api
+
+
 def is_compatible_version(client_version: str, api_version: str) -> bool:
     """
     Check if client and API versions are compatible using semantic versioning.
@@ -99,26 +140,18 @@ def is_compatible_version(client_version: str, api_version: str) -> bool:
         >>> is_compatible_version("1.0.0", "2.0.0")
         False
     """
-    try:
-        # Parse both versions
-        client_major, client_minor, client_patch = parse_version(client_version)
-        api_major, api_minor, api_patch = parse_version(api_version)
-
-        # Same major version = compatible (following semantic versioning)
-        return client_major == api_major
-
-    except ValueError as e:
-        logger.warning(f"Version parsing error: {e}")
-        return False
+    return _classify(client_version, api_version)[0]
 
 
+@lru_cache(maxsize=512)
 def get_compatibility_warning(client_version: str, api_version: str) -> Optional[str]:
     """
     Generate compatibility warning message if versions are incompatible.
 
     This function creates user-friendly warning messages when client and API
     versions are not compatible. It provides specific guidance based on the
-    type of incompatibility detected.
+    type of incompatibility detected. Messages are memoized per version pair, so
+    each one is only built the first time a client version is seen.
 
     Warning Types:
     1. Major version mismatch: Suggests client upgrade (breaking changes)
@@ -142,28 +175,24 @@ def get_compatibility_warning(client_version: str, api_version: str) -> Optional
         >>> get_compatibility_warning("1.5.0", "1.0.0")
         "Version compatibility unknown: Client v1.5.0 with API v1.0.0..."
     """
-    if is_compatible_version(client_version, api_version):
+    compatible, client, api = _classify(client_version, api_version)
+    if compatible:
         return None
 
-    try:
-        client_major, _, _ = parse_version(client_version)
-        api_major, _, _ = parse_version(api_version)
-
-        if client_major != api_major:
-            return (
-                f"Major version mismatch: Client v{client_version} may not be compatible "
-                f"with API v{api_version}. Consider upgrading your client library."
-            )
-        else:
-            return (
-                f"Version compatibility unknown: Client v{client_version} with API v{api_version}. "
-                f"This combination has not been tested."
-            )
-    except ValueError:
+    if client is None or api is None:
         return (
             f"Invalid version format detected: Client v{client_version}, API v{api_version}. "
             f"Please check your client library version."
         )
+    if client[0] != api[0]:
+        return (
+            f"Major version mismatch: Client v{client_version} may not be compatible "
+            f"with API v{api_version}. Consider upgrading your client library."
+        )
+    return (
+        f"Version compatibility unknown: Client v{client_version} with API v{api_version}. "
+        f"This combination has not been tested."
+    )
 
 
 def log_version_info(client_version: str, user_agent: Optional[str] = None):
@@ -191,13 +220,18 @@ def log_version_info(client_version: str, user_agent: Optional[str] = None):
         WARNING: "Version compatibility: Major version mismatch: Client v1.0.0..."
         DEBUG: "User agent: wave-python-client/1.0.0"
     """
-    # Check compatibility and log appropriate message
+    # Runs on every versioned request, so messages use lazy %-formatting and are only
+    # rendered when the record passes the level filter. Every message here is WARNING or
+    # DEBUG, so nothing can be emitted when WARNING is filtered out.
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+
     warning = get_compatibility_warning(client_version, API_VERSION)
     if warning:
-        logger.warning(f"Version compatibility: {warning}")
+        logger.warning("Version compatibility: %s", warning)
     else:
-        logger.debug(f"Compatible versions: Client v{client_version}, API v{API_VERSION}")
+        logger.debug("Compatible versions: Client v%s, API v%s", client_version, API_VERSION)
 
     # Log user agent for additional context
     if user_agent:
-        logger.debug(f"User agent: {user_agent}")
+        logger.debug("User agent: %s", user_agent)
@@ -1,7 +1,8 @@
 """Configuration for large-scale tests."""
 
 import os
-from typing import Dict, Generator, Optional
+from types import MappingProxyType
+from typing import Generator, Mapping, Optional
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -13,46 +14,63 @@ from wave_backend.auth.unkey_client import UnkeyClient, UnkeyValidationResult
 # Load environment variables from .env file
 load_dotenv()
 
+# Real test-role key, read once rather than on every mocked validation
+_WAVE_API_KEY = os.getenv("WAVE_API_KEY")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test that uses the real Unkey client as a network test."""
+    for item in items:
+        if "real_unkey_client" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.network)
+
+
+def _mock_result(role: Role, key_id: str) -> UnkeyValidationResult:
+    role_name = str(role)  # Role.__str__ is already the lowercase name
+    return UnkeyValidationResult(
+        valid=True, key_id=key_id, role=role, permissions=[role_name], roles=[role_name]
+    )
+
+
+# Mocked results are built once per role and shared, since no caller mutates them
+_VALIDATION_RESULTS = {
+    Role.ADMIN: _mock_result(Role.ADMIN, "mock_admin_key_id"),
+    Role.RESEARCHER: _mock_result(Role.RESEARCHER, "mock_researcher_key_id"),
+    Role.EXPERIMENTEE: _mock_result(Role.EXPERIMENTEE, "mock_experimentee_key_id"),
+    Role.TEST: _mock_result(Role.TEST, "test_key_id"),
+}
+_INVALID_RESULT = UnkeyValidationResult(valid=False, error="Invalid API key")
+
+# Key substrings checked in order, with the role each one simulates. A key ending in
+# "_admin" etc. always contains the substring, so one check covers both cases.
+_KEY_PATTERN_ROLES = (
+    ("admin", Role.ADMIN),
+    ("researcher", Role.RESEARCHER),
+    ("experimentee", Role.EXPERIMENTEE),
+)
+
 
 async def mock_validate(key: str, required_role: Optional[Role] = None):
     # Simulate different responses based on key pattern for testing
-    user_role = None
-    key_id = None
-
-    if "admin" in key or key.endswith("_admin"):
-        user_role = Role.ADMIN
-        key_id = "mock_admin_key_id"
-    elif "researcher" in key or key.endswith("_researcher"):
-        user_role = Role.RESEARCHER
-        key_id = "mock_researcher_key_id"
-    elif "experimentee" in key or key.endswith("_experimentee"):
-        user_role = Role.EXPERIMENTEE
-        key_id = "mock_experimentee_key_id"
-    elif "test" in key or key == os.getenv("WAVE_API_KEY"):
-        # Use test role for real key and test-pattern keys
-        user_role = Role.TEST
-        key_id = "test_key_id"
-    elif "invalid" in key:
-        return UnkeyValidationResult(valid=False, error="Invalid API key")
+    for pattern, user_role in _KEY_PATTERN_ROLES:
+        if pattern in key:
+            break
     else:
-        # Default to experimentee for other mock scenarios
-        user_role = Role.EXPERIMENTEE
-        key_id = "mock_experimentee_key_id"
+        if "test" in key or key == _WAVE_API_KEY:
+            # Use test role for real key and test-pattern keys
+            user_role = Role.TEST
+        elif "invalid" in key:
+            return _INVALID_RESULT
+        else:
+            # Default to experimentee for other mock scenarios
+            user_role = Role.EXPERIMENTEE
 
     # Note: We don't check required_role here - that's handled by the decorator
     # The mock just validates the key exists and returns the user's role
-
-    # Return successful validation
-    return UnkeyValidationResult(
-        valid=True,
-        key_id=key_id,
-        role=user_role,
-        permissions=[str(user_role).lower()],
-        roles=[str(user_role).lower()],
-    )
+    return _VALIDATION_RESULTS[user_role]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def unkey_api_key() -> str:
     """Get Unkey root validator key from environment."""
     api_key = os.getenv("ROOT_VALIDATOR_KEY")
@@ -61,7 +79,7 @@ def unkey_api_key() -> str:
     return api_key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_api_key() -> str:
     """Get user API key for cross-validation testing."""
     api_key = os.getenv("WAVE_API_KEY")
@@ -70,13 +88,36 @@ def user_api_key() -> str:
     return api_key
 
 
+# Rejections seen by real_unkey_client this session, keyed on (key, required_role)
+_INVALID_KEY_RESULTS: dict[tuple[str, Optional[Role]], UnkeyValidationResult] = {}
+
+
 @pytest.fixture
-def real_unkey_client() -> UnkeyClient:
-    """Create UnkeyClient with real root validator key for integration testing."""
+def real_unkey_client(monkeypatch: pytest.MonkeyPatch) -> UnkeyClient:
+    """Create UnkeyClient with real root validator key for integration testing.
+
+    A key Unkey has already rejected this session is answered with that same rejection
+    instead of another round-trip. Valid results are never reused.
+    """
     root_key = os.getenv("ROOT_VALIDATOR_KEY")
     if not root_key:
         pytest.skip("ROOT_VALIDATOR_KEY not set - skipping real Unkey integration tests")
-    return UnkeyClient(root_key)
+    client = UnkeyClient(root_key)
+    validate_key = client.validate_key
+
+    async def validate_key_once_invalid(
+        key: str, required_role: Optional[Role] = None
+    ) -> UnkeyValidationResult:
+        cached = _INVALID_KEY_RESULTS.get((key, required_role))
+        if cached is not None:
+            return cached
+        result = await validate_key(key, required_role)
+        if not result.valid:
+            _INVALID_KEY_RESULTS[(key, required_role)] = result
+        return result
+
+    monkeypatch.setattr(client, "validate_key", validate_key_once_invalid)
+    return client
 
 
 class RedactedApiKey(str):
@@ -89,7 +130,7 @@ class RedactedApiKey(str):
         return f"{self[:8]}...{self[-4:]}" if len(self) > 12 else "[REDACTED]"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_role_key() -> RedactedApiKey:
     """Get the real test role API key from environment.
 
@@ -102,15 +143,36 @@ def test_role_key() -> RedactedApiKey:
     return RedactedApiKey(api_key)
 
 
-@pytest.fixture
-def test_keys() -> Dict[str, Optional[str]]:
+@pytest.fixture(scope="session")
+def test_keys() -> Mapping[str, Optional[str]]:
     """Test API keys - expecting only test role credentials from environment
-    Other roles will be simulated via mocking for comprehensive testing"""
-    return {
-        "test": os.getenv("WAVE_API_KEY"),  # Main test key with "test" role
-        "invalid": "sk_invalid_key_12345",  # Always invalid key for negative testing
-        "malformed": "invalid_format",  # Malformed key for edge case testing
-    }
+    Other roles will be simulated via mocking for comprehensive testing
+
+    Shared by the whole session, so the mapping is read-only."""
+    return MappingProxyType(
+        {
+            "test": _WAVE_API_KEY,  # Main test key with "test" role
+            "invalid": "sk_invalid_key_12345",  # Always invalid key for negative testing
+            "malformed": "invalid_format",  # Malformed key for edge case testing
+        }
+    )
+
+
+@pytest.fixture
+def reset_auth_caches() -> Generator[None, None, None]:
+    """Clear the cached auth config and Unkey client before and after the test.
+
+    Pair with monkeypatch.setenv so a client built from patched variables never
+    outlives the test that patched them.
+    """
+    from wave_backend.auth.config import get_auth_config
+    from wave_backend.auth.unkey_client import get_unkey_client
+
+    get_auth_config.cache_clear()
+    get_unkey_client.cache_clear()
+    yield
+    get_auth_config.cache_clear()
+    get_unkey_client.cache_clear()
 
 
 @pytest.fixture
@@ -130,6 +192,21 @@ def mock_unkey_client() -> Generator[AsyncMock, None, None]:
     get_unkey_client.cache_clear()
 
 
+@pytest.fixture
+def fast_mock_unkey_client(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Patch UnkeyClient.validate_key with mock_validate directly.
+
+    Skips AsyncMock's call recording for tests that only need keys to resolve to roles.
+    Use mock_unkey_client when a test inspects or reconfigures the mock.
+    """
+    from wave_backend.auth.unkey_client import get_unkey_client
+
+    get_unkey_client.cache_clear()
+    monkeypatch.setattr(UnkeyClient, "validate_key", staticmethod(mock_validate))
+    yield
+    get_unkey_client.cache_clear()
+
+
 @pytest.fixture
 def mock_network_failure(mock_unkey_client: AsyncMock) -> AsyncMock:
     """Configure mock client to simulate network failures."""
@@ -5,22 +5,70 @@ with various auth decorator combinations.
 """
 
 import asyncio
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import httpx
 import pytest
-from fastapi import Depends, FastAPI
+import pytest_asyncio
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from wave_backend.auth.decorator import auth
+from wave_backend.auth.decorator import auth, require_role
 from wave_backend.auth.roles import Role
-from wave_backend.auth.unkey_client import UnkeyValidationResult
+from wave_backend.auth.unkey_client import (
+    UnkeyClient,
+    UnkeyValidationResult,
+    get_unkey_client,
+)
 from wave_backend.models.database import get_db
 
+# The apps and their clients are shared across this module, so tests run on one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-async def basic_test_app():
+
+# validate_key is patched on the class by the mock fixtures, so this client never calls Unkey.
+# It also stands in for get_unkey_client in every app under test here.
+_UNKEY_CLIENT = UnkeyClient("sk_test_root_key", base_url="http://unkey.test")
+_CREDENTIALS = HTTPAuthorizationCredentials(scheme="Bearer", credentials="test_key")
+_require_researcher = require_role(Role.RESEARCHER)
+
+
+# Request headers shared by the tests below; httpx copies them and never mutates the dicts
+RESEARCHER_HEADERS = {"Authorization": "Bearer researcher_key"}
+ADMIN_HEADERS = {"Authorization": "Bearer admin_key"}
+EXPERIMENTEE_HEADERS = {"Authorization": "Bearer experimentee_key"}
+TEST_KEY_HEADERS = {"Authorization": "Bearer test_key"}
+INVALID_KEY_HEADERS = {"Authorization": "Bearer invalid_key"}
+MALFORMED_HEADERS = {"Authorization": "NotBearer invalid_format"}
+EMPTY_TOKEN_HEADERS = {"Authorization": "Bearer "}
+
+# One distinct researcher key per concurrent request
+CONCURRENT_HEADERS = [{"Authorization": f"Bearer researcher_key_{i}"} for i in range(20)]
+
+
+def _get_stub_unkey_client() -> UnkeyClient:
+    return _UNKEY_CLIENT
+
+
+@asynccontextmanager
+async def _client_for(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """Open a client for app, resolving the Unkey client dependency to the shared stub."""
+    # Skips get_unkey_client's config lookup, so these tests need no ROOT_VALIDATOR_KEY
+    app.dependency_overrides[get_unkey_client] = _get_stub_unkey_client
+    try:
+        async with AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+    finally:
+        app.dependency_overrides.pop(get_unkey_client, None)
+
+
+@pytest.fixture(scope="module")
+def basic_test_app():
     """Create a basic test FastAPI app with auth-protected endpoints."""
     app = FastAPI()
 
@@ -62,8 +110,8 @@ async def basic_test_app():
     return app
 
 
-@pytest.fixture
-async def simple_test_app():
+@pytest.fixture(scope="module")
+def simple_test_app():
     """Create a simple test app for error testing scenarios."""
     app = FastAPI()
 
@@ -75,8 +123,8 @@ async def simple_test_app():
     return app
 
 
-@pytest.fixture
-async def concurrent_test_app():
+@pytest.fixture(scope="module")
+def concurrent_test_app():
     """Create test app for concurrent authentication testing."""
     app = FastAPI()
 
@@ -89,159 +137,131 @@ async def concurrent_test_app():
     return app
 
 
-class TestAuthenticatedEndpoints:
-    """Test auth decorators on actual FastAPI endpoints."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def basic_client(basic_test_app):
+    """Provide one HTTP client for the basic test app."""
+    async with _client_for(basic_test_app) as client:
+        yield client
 
-    @pytest.mark.asyncio
-    async def test_public_endpoint_with_valid_key(self, basic_test_app, mock_auth_success):
-        """Test public endpoint with valid API key."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/public", headers={"Authorization": "Bearer researcher_key"}
-            )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["message"] == "public access"
-            assert data["key_id"] == "mock_researcher_key_id"
-            assert data["role"] == "researcher"
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def real_app_client():
+    """Provide one HTTP client for the real WAVE Backend application."""
+    from wave_backend.api.main import app
 
-    @pytest.mark.asyncio
-    async def test_public_endpoint_with_invalid_key(self, basic_test_app, mock_auth_success):
-        """Test public endpoint with invalid API key."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get("/public", headers={"Authorization": "Bearer invalid_key"})
+    async with _client_for(app) as client:
+        yield client
 
-            assert response.status_code == 401
-            assert "Authentication failed" in response.json()["detail"]
 
-    @pytest.mark.asyncio
-    async def test_researcher_endpoint_with_researcher_key(self, basic_test_app, mock_auth_success):
-        """Test researcher endpoint with researcher-level key."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/researcher-only", headers={"Authorization": "Bearer researcher_key"}
-            )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def simple_client(simple_test_app):
+    """Provide one HTTP client for the simple error-testing app."""
+    async with _client_for(simple_test_app) as client:
+        yield client
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["message"] == "researcher access"
-            assert data["role"] == "researcher"
 
-    @pytest.mark.asyncio
-    async def test_researcher_endpoint_with_admin_key(self, basic_test_app, mock_auth_success):
-        """Test researcher endpoint with admin-level key (should work due to hierarchy)."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/researcher-only", headers={"Authorization": "Bearer admin_key"}
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert data["message"] == "researcher access"
-            assert data["role"] == "admin"
-
-    @pytest.mark.asyncio
-    async def test_admin_endpoint_with_insufficient_permissions(
-        self, basic_test_app, mock_insufficient_permissions
-    ):
-        """Test admin endpoint with insufficient permissions."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/admin-only", headers={"Authorization": "Bearer experimentee_key"}
-            )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def concurrent_client(concurrent_test_app):
+    """Provide one HTTP client for the concurrent test app."""
+    async with _client_for(concurrent_test_app) as client:
+        yield client
 
-            assert response.status_code == 403
-            assert "Insufficient permissions" in response.json()["detail"]
 
-    @pytest.mark.asyncio
-    async def test_endpoint_without_auth_header(self, basic_test_app):
-        """Test endpoint access without Authorization header."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get("/public")
-
-            assert response.status_code == 401
-            assert "authent" in response.json()["detail"].lower()
+class TestAuthenticatedEndpoints:
+    """Test auth decorators on actual FastAPI endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_endpoint_with_malformed_auth_header(self, basic_test_app):
-        """Test endpoint with malformed Authorization header."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/public", headers={"Authorization": "NotBearer invalid_format"}
-            )
+    @pytest.mark.parametrize(
+        "path,headers,expected",
+        [
+            pytest.param(
+                "/public",
+                RESEARCHER_HEADERS,
+                {
+                    "message": "public access",
+                    "key_id": "mock_researcher_key_id",
+                    "role": "researcher",
+                },
+                id="public_with_researcher_key",
+            ),
+            pytest.param(
+                "/researcher-only",
+                RESEARCHER_HEADERS,
+                {"message": "researcher access", "role": "researcher"},
+                id="researcher_with_researcher_key",
+            ),
+            # Admin outranks researcher in the role hierarchy
+            pytest.param(
+                "/researcher-only",
+                ADMIN_HEADERS,
+                {"message": "researcher access", "role": "admin"},
+                id="researcher_with_admin_key",
+            ),
+        ],
+    )
+    async def test_endpoint_with_valid_key(
+        self, basic_client, fast_mock_unkey_client, path, headers, expected
+    ):
+        """Test endpoints accept keys whose role meets the requirement."""
+        response = await basic_client.get(path, headers=headers)
 
-            assert response.status_code == 401
-            assert "authent" in response.json()["detail"].lower()
+        assert response.status_code == 200
+        data = response.json()
+        for field, value in expected.items():
+            assert data[field] == value
 
-    @pytest.mark.asyncio
-    async def test_endpoint_with_empty_token(self, basic_test_app):
-        """Test endpoint with empty bearer token."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.get("/public", headers={"Authorization": "Bearer "})
+    async def test_admin_endpoint_with_insufficient_permissions(
+        self, basic_client, mock_insufficient_permissions
+    ):
+        """Test admin endpoint with insufficient permissions."""
+        response = await basic_client.get("/admin-only", headers=EXPERIMENTEE_HEADERS)
+
+        assert response.status_code == 403
+        assert "Insufficient permissions" in response.json()["detail"]
+
+    @pytest.mark.parametrize(
+        "headers,detail",
+        [
+            pytest.param(INVALID_KEY_HEADERS, "Authentication failed", id="invalid_key"),
+            pytest.param({}, "authent", id="missing_header"),
+            pytest.param(MALFORMED_HEADERS, "authent", id="malformed_header"),
+            pytest.param(EMPTY_TOKEN_HEADERS, "authent", id="empty_token"),
+        ],
+    )
+    async def test_endpoint_rejects_credentials(
+        self, basic_client, fast_mock_unkey_client, headers, detail
+    ):
+        """Test endpoints reject missing, malformed and invalid credentials."""
+        response = await basic_client.get("/public", headers=headers)
 
-            assert response.status_code == 401
-            assert "authent" in response.json()["detail"].lower()
+        assert response.status_code == 401
+        assert detail.lower() in response.json()["detail"].lower()
 
-    @pytest.mark.asyncio
-    async def test_endpoint_with_database_dependency(self, basic_test_app, mock_auth_success):
+    async def test_endpoint_with_database_dependency(self, basic_client, fast_mock_unkey_client):
         """Test endpoint that combines auth and database dependencies."""
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=basic_test_app), base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/with-db",
-                headers={"Authorization": "Bearer researcher_key"},
-                json={"test": "data"},
-            )
+        response = await basic_client.post(
+            "/with-db",
+            headers=RESEARCHER_HEADERS,
+            json={"test": "data"},
+        )
 
-            # This might fail due to database setup, but should get past auth
-            assert response.status_code != 401  # Not an auth error
-            assert response.status_code != 403  # Not a permissions error
+        # This might fail due to database setup, but should get past auth
+        assert response.status_code != 401  # Not an auth error
+        assert response.status_code != 403  # Not a permissions error
 
 
 class TestAuthErrorHandling:
     """Test comprehensive error handling in auth system."""
 
-    @pytest.mark.asyncio
+    # Unkey failures are raised by the auth dependency itself, so these call it directly
     async def test_network_timeout_error(self, mock_network_failure):
         """Test behavior when Unkey API times out."""
-        # Create test app with mock dependency
-        app = FastAPI()
+        with pytest.raises(HTTPException) as exc_info:
+            await _require_researcher(_CREDENTIALS, _UNKEY_CLIENT)
 
-        @app.get("/test-endpoint")
-        @auth.role(Role.RESEARCHER)
-        async def test_endpoint(auth: tuple[str, Role]):
-            return {"success": True}
+        # Should return 401 with timeout error message
+        assert exc_info.value.status_code == 401
+        assert "Timeout connecting to Unkey API" in exc_info.value.detail
 
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/test-endpoint", headers={"Authorization": "Bearer test_key"}
-            )
-
-            # Should return 401 with timeout error message
-            assert response.status_code == 401
-            assert "Timeout connecting to Unkey API" in response.json()["detail"]
-
-    @pytest.mark.asyncio
     async def test_unkey_service_error(self, mock_unkey_client):
         """Test behavior when Unkey service returns error."""
         # Configure mock for service error
@@ -250,26 +270,13 @@ class TestAuthErrorHandling:
             valid=False, error="Unkey service temporarily unavailable"
         )
 
-        # Create test app
-        app = FastAPI()
-
-        @app.get("/test-endpoint")
-        @auth.role(Role.RESEARCHER)
-        async def test_endpoint(auth: tuple[str, Role]):
-            return {"success": True}
+        with pytest.raises(HTTPException) as exc_info:
+            await _require_researcher(_CREDENTIALS, _UNKEY_CLIENT)
 
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/test-endpoint", headers={"Authorization": "Bearer test_key"}
-            )
+        assert exc_info.value.status_code == 401
+        assert "Authentication failed" in exc_info.value.detail
 
-            assert response.status_code == 401
-            assert "Authentication failed" in response.json()["detail"]
-
-    @pytest.mark.asyncio
-    async def test_missing_role_in_response(self, mock_unkey_client):
+    async def test_missing_role_in_response(self, simple_client, mock_unkey_client):
         """Test behavior when Unkey response is valid but has no role."""
         # Configure mock for missing role
         mock_unkey_client.side_effect = None
@@ -277,134 +284,89 @@ class TestAuthErrorHandling:
             valid=True, key_id="test_key", role=None  # No role in response
         )
 
-        # Create test app
-        app = FastAPI()
+        response = await simple_client.get("/test-endpoint", headers=TEST_KEY_HEADERS)
 
-        @app.get("/test-endpoint")
-        @auth.role(Role.RESEARCHER)
-        async def test_endpoint(auth: tuple[str, Role]):
-            return {"success": True}
-
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get(
-                "/test-endpoint", headers={"Authorization": "Bearer test_key"}
-            )
-
-            assert response.status_code == 403
-            assert "No role assigned" in response.json()["detail"]
+        assert response.status_code == 403
+        assert "No role assigned" in response.json()["detail"]
 
 
 class TestRealEndpointIntegration:
     """Test authentication on real application endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_health_endpoint_no_auth_required(self):
+    async def test_health_endpoint_no_auth_required(self, real_app_client):
         """Test that health endpoint doesn't require auth."""
-        from wave_backend.api.main import app
-
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/health")
+        response = await real_app_client.get("/health")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
 
-    @pytest.mark.asyncio
-    async def test_root_endpoint_no_auth_required(self):
+    async def test_root_endpoint_no_auth_required(self, real_app_client):
         """Test that root endpoint doesn't require auth."""
-        from wave_backend.api.main import app
+        response = await real_app_client.get("/")
 
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/")
+        assert response.status_code == 200
+        data = response.json()
+        assert "Welcome to the WAVE Backend API" in data["message"]
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "Welcome to the WAVE Backend API" in data["message"]
-
-    @pytest.mark.asyncio
-    async def test_openapi_docs_accessible(self):
+    async def test_openapi_docs_accessible(self, real_app_client):
         """Test that OpenAPI documentation is accessible."""
-        from wave_backend.api.main import app
-
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            response = await client.get("/docs")
+        response = await real_app_client.get("/docs")
 
-            # Should redirect or serve docs page
-            assert response.status_code in [200, 307]
+        # Should redirect or serve docs page
+        assert response.status_code in [200, 307]
 
-    @pytest.mark.asyncio
-    async def test_experiments_endpoint_requires_auth(self, mock_auth_success):
+    async def test_experiments_endpoint_requires_auth(
+        self, real_app_client, fast_mock_unkey_client
+    ):
         """Test that experiments endpoint requires authentication."""
-        from wave_backend.api.main import app
+        # Without auth header
+        response = await real_app_client.get("/api/v1/experiments/")
+        assert response.status_code == 401  # Expecting 401 for missing auth
+
+        # With valid auth header
+        try:
+            response = await real_app_client.get("/api/v1/experiments/", headers=RESEARCHER_HEADERS)
+            # Should get past auth (might fail on database connection, but not auth)
+            assert response.status_code != 403  # Auth passed
+            # We expect it might fail on DB connection (500) but not auth (403)
+        except Exception as e:
+            # Allow database-related errors that indicate auth passed but DB is unavailable
+            # This is expected in large tests without DB setup
+            from sqlalchemy.exc import DatabaseError, DisconnectionError
+
+            # Check for specific database-related exceptions or error messages
+            is_db_error = (
+                isinstance(e, (OSError, DatabaseError, DisconnectionError))
+                or "asyncpg.exceptions.undefinedtableerror" in str(e).lower()
+                or "connect call failed" in str(e).lower()
+            )
 
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            # Without auth header
-            response = await client.get("/api/v1/experiments/")
-            assert response.status_code == 401  # Expecting 401 for missing auth
-
-            # With valid auth header
-            try:
-                response = await client.get(
-                    "/api/v1/experiments/", headers={"Authorization": "Bearer researcher_key"}
-                )
-                # Should get past auth (might fail on database connection, but not auth)
-                assert response.status_code != 403  # Auth passed
-                # We expect it might fail on DB connection (500) but not auth (403)
-            except Exception as e:
-                # Allow database-related errors that indicate auth passed but DB is unavailable
-                # This is expected in large tests without DB setup
-                from sqlalchemy.exc import DatabaseError, DisconnectionError
-
-                # Check for specific database-related exceptions or error messages
-                is_db_error = (
-                    isinstance(e, (OSError, DatabaseError, DisconnectionError))
-                    or "asyncpg.exceptions.undefinedtableerror" in str(e).lower()
-                    or "connect call failed" in str(e).lower()
-                )
-
-                if is_db_error:
-                    # Expected database error - auth validation passed successfully
-                    # We can see in logs:
-                    # "Authorized access - Key ID: mock_researcher_key_id, Role: researcher"
-                    pass
-                else:
-                    # Unexpected error - re-raise it
-                    raise
+            if is_db_error:
+                # Expected database error - auth validation passed successfully
+                # We can see in logs:
+                # "Authorized access - Key ID: mock_researcher_key_id, Role: researcher"
+                pass
+            else:
+                # Unexpected error - re-raise it
+                raise
 
 
 class TestConcurrentAuthRequests:
     """Test auth system under concurrent load."""
 
-    @pytest.mark.asyncio
-    async def test_concurrent_auth_requests(self, concurrent_test_app, mock_auth_success):
+    async def test_concurrent_auth_requests(self, concurrent_client, fast_mock_unkey_client):
         """Test multiple concurrent authentication requests."""
-
-        async def make_request(client, key_suffix):
-            response = await client.get(
-                "/concurrent-test", headers={"Authorization": f"Bearer researcher_key_{key_suffix}"}
-            )
-            return response
-
-        async with AsyncClient(
-            transport=httpx.ASGITransport(app=concurrent_test_app), base_url="http://test"
-        ) as client:
-            # Make 20 concurrent requests
-            tasks = [make_request(client, i) for i in range(20)]
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # All should succeed
-            for i, response in enumerate(responses):
-                assert not isinstance(response, Exception), f"Request {i} failed: {response}"
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
+        # Make 20 concurrent requests; the task group fails the test if any request raises
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(concurrent_client.get("/concurrent-test", headers=headers))
+                for headers in CONCURRENT_HEADERS
+            ]
+
+        # All should succeed
+        for task in tasks:
+            response = task.result()
+            assert response.status_code == 200
+            data = response.json()
+            assert data["success"] is True
@@ -4,26 +4,30 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from wave_backend.api.main import app
 from wave_backend.auth.roles import Role
+from wave_backend.auth.unkey_client import UnkeyValidationResult
 from wave_backend.models.database import Base, get_db
 from wave_backend.models.database_config import db_config
+from wave_backend.models.models import create_missing_indexes, ensure_trigram_indexes
+from wave_backend.services.experiment_data import ExperimentDataService
 
+# One engine for the whole test session. pyproject.toml runs tests and async fixtures on
+# a single session event loop, so pooled asyncpg connections never cross event loops.
+test_engine = create_async_engine(db_config.get_database_url(test=True), echo=False)
 
-async def override_get_db():
-    """Override database dependency for testing."""
-    # Create engine and session inside the async function to avoid event loop issues
-    test_database_url = db_config.get_database_url(test=True)
-    test_engine = create_async_engine(test_database_url, echo=False)
-    TestSessionLocal = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+# Sessions are bound to the per-test connection. Their commits and rollbacks only act on
+# a SAVEPOINT, so the connection's outer transaction still undoes everything afterwards.
+TestSessionLocal = async_sessionmaker(
+    class_=AsyncSession, expire_on_commit=False, join_transaction_mode="create_savepoint"
+)
 
-    async with TestSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
-# Set up the dependency override
-app.dependency_overrides[get_db] = override_get_db
+# Every key validates as TEST; nothing mutates the result, so one instance serves every call
+_TEST_VALIDATION_RESULT = UnkeyValidationResult(
+    valid=True,
+    key_id="test_key_id",
+    role=Role.TEST,
+    permissions=["test"],
+    roles=["test"],
+)
 
 
 @pytest.fixture(autouse=True)
@@ -31,17 +35,11 @@ def mock_auth():
     """Mock authentication for all medium tests."""
     from unittest.mock import patch
 
-    from wave_backend.auth.unkey_client import UnkeyClient, UnkeyValidationResult
+    from wave_backend.auth.unkey_client import UnkeyClient
 
     async def mock_validate(key: str, required_role=None):
         """Mock validation that always returns TEST role."""
-        return UnkeyValidationResult(
-            valid=True,
-            key_id="test_key_id",
-            role=Role.TEST,
-            permissions=["test"],
-            roles=["test"],
-        )
+        return _TEST_VALIDATION_RESULT
 
     # Clear the LRU cache to avoid using cached real client
     from wave_backend.auth.unkey_client import get_unkey_client
@@ -58,53 +56,41 @@ def mock_auth():
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_database():
-    """Set up test database tables once per session."""
-    import asyncio
-
-    async def setup():
-        test_database_url = db_config.get_database_url(test=True)
-        test_engine = create_async_engine(test_database_url, echo=False)
-        async with test_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        await test_engine.dispose()
-
-    # Run setup
-    asyncio.run(setup())
-    yield
+async def setup_test_database():
+    """Set up test database tables once per session and dispose the shared engine."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+    await ensure_trigram_indexes(test_engine)
 
-    # Cleanup
-    async def cleanup():
-        test_database_url = db_config.get_database_url(test=True)
-        test_engine = create_async_engine(test_database_url, echo=False)
-        async with test_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-        await test_engine.dispose()
+    yield
 
-    asyncio.run(cleanup())
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
 @pytest.fixture(autouse=True)
-def clean_database_between_tests():
-    """Clean database between each test to avoid conflicts."""
-    import asyncio
-
-    yield  # Run test first
+async def db_connection():
+    """Run each test in a transaction that is rolled back afterwards to avoid conflicts."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
 
-    # Clean up after each test
-    async def cleanup():
-        test_database_url = db_config.get_database_url(test=True)
-        test_engine = create_async_engine(test_database_url, echo=False)
-        async with test_engine.begin() as conn:
-            from sqlalchemy import text
+        async def override_get_db():
+            """Override database dependency for testing."""
+            async with TestSessionLocal(bind=conn) as session:
+                yield session
 
-            # Clean data but keep tables
-            await conn.execute(text("TRUNCATE TABLE experiments RESTART IDENTITY CASCADE"))
-            await conn.execute(text("TRUNCATE TABLE experiment_types RESTART IDENTITY CASCADE"))
-            await conn.execute(text("TRUNCATE TABLE tags RESTART IDENTITY CASCADE"))
-        await test_engine.dispose()
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            yield conn
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await trans.rollback()
 
-    asyncio.run(cleanup())
+            # Experiment data tables created during the test were rolled back with it
+            for table_name in list(ExperimentDataService._table_cache):
+                ExperimentDataService._forget_table(table_name)
 
 
 @pytest.fixture
@@ -118,16 +104,7 @@ async def async_client():
 
 
 @pytest.fixture
-async def db_session():
+async def db_session(db_connection):
     """Provide a database session for service tests."""
-    test_database_url = db_config.get_database_url(test=True)
-    test_engine = create_async_engine(test_database_url, echo=False)
-    TestSessionLocal = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with TestSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-    await test_engine.dispose()
+    async with TestSessionLocal(bind=db_connection) as session:
+        yield session
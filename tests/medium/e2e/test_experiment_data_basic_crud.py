@@ -28,6 +28,34 @@ async def test_create_experiment_data(async_client, experiment_setup, sample_exp
     assert_experiment_data_matches(created_data, sample_experiment_data)
 
 
+@pytest.mark.asyncio
+async def test_create_experiment_data_bulk(async_client, experiment_setup, sample_experiment_data):
+    """Test creating several experiment data rows in one request."""
+    headers = {"Authorization": "Bearer test_token"}
+    experiment_uuid = experiment_setup["experiment_uuid"]
+    participant_id = experiment_setup["participant_id"]
+
+    response = await async_client.post(
+        f"/api/v1/experiment-data/{experiment_uuid}/data/bulk",
+        json={"rows": [sample_experiment_data] * 3},
+        headers=headers,
+    )
+
+    assert response.status_code == 201
+    result = response.json()
+    assert result["count"] == 3
+    assert result["row_ids"] == sorted(result["row_ids"])
+
+    # Rows are readable individually
+    get_response = await async_client.get(
+        f"/api/v1/experiment-data/{experiment_uuid}/data/row/{result['row_ids'][0]}",
+        headers=headers,
+    )
+    assert get_response.status_code == 200
+    assert_experiment_data_response(get_response.json(), participant_id)
+    assert_experiment_data_matches(get_response.json(), sample_experiment_data)
+
+
 @pytest.mark.asyncio
 async def test_get_specific_experiment_data_row(
     async_client, experiment_setup, sample_experiment_data
@@ -0,0 +1,138 @@
+"""Tests for ExperimentDataService bulk operations."""
+
+import pytest
+
+from wave_backend.schemas.schemas import ExperimentCreate, ExperimentTypeCreate
+from wave_backend.services.experiment_data import COPY_MIN_ROWS, ExperimentDataService
+from wave_backend.services.experiment_types import ExperimentTypeService
+from wave_backend.services.experiments import ExperimentService
+
+
+@pytest.fixture
+async def bulk_experiment(db_session):
+    """Create an experiment type and experiment for bulk insert tests."""
+    exp_type = await ExperimentTypeService.create_experiment_type(
+        db_session,
+        ExperimentTypeCreate(
+            name="bulk_insert_test",
+            table_name="bulk_insert_test_data",
+            schema_definition={"score": "INTEGER", "details": "JSON"},
+        ),
+    )
+    experiment = await ExperimentService.create_experiment(
+        db_session,
+        ExperimentCreate(experiment_type_id=exp_type.id, description="Bulk insert test"),
+    )
+
+    yield exp_type.table_name, str(experiment.uuid)
+
+    await ExperimentDataService.drop_experiment_table(exp_type.table_name, db_session)
+
+
+@pytest.mark.parametrize("row_count", [3, COPY_MIN_ROWS])
+async def test_insert_data_rows(db_session, bulk_experiment, row_count):
+    """Test bulk insert returns ordered IDs for both the INSERT and COPY paths."""
+    table_name, experiment_uuid = bulk_experiment
+    rows = [
+        {"participant_id": f"P{i:03d}", "score": i, "details": {"trial": i}}
+        for i in range(row_count)
+    ]
+
+    row_ids = await ExperimentDataService.insert_data_rows(
+        table_name, experiment_uuid, rows, db_session
+    )
+
+    assert len(row_ids) == row_count
+    assert row_ids == sorted(row_ids)
+    last = await ExperimentDataService.get_data_row_by_id(table_name, row_ids[-1], db_session)
+    assert last["participant_id"] == f"P{row_count - 1:03d}"
+    assert last["details"] == {"trial": row_count - 1}
+
+
+async def test_insert_data_rows_unknown_column(db_session, bulk_experiment):
+    """Test bulk insert rejects columns missing from the experiment type schema."""
+    table_name, experiment_uuid = bulk_experiment
+
+    with pytest.raises(ValueError, match="Unknown columns"):
+        await ExperimentDataService.insert_data_rows(
+            table_name, experiment_uuid, [{"participant_id": "P001", "bogus": 1}], db_session
+        )
+
+
+async def test_insert_many(db_session, bulk_experiment):
+    """Test batched INSERT path regardless of batch size."""
+    table_name, experiment_uuid = bulk_experiment
+    rows = [{"participant_id": f"P{i:03d}", "score": i} for i in range(COPY_MIN_ROWS + 1)]
+
+    row_ids = await ExperimentDataService.insert_many(table_name, experiment_uuid, rows, db_session)
+
+    assert len(row_ids) == len(rows)
+    count = await ExperimentDataService.count_data_rows(table_name, db_session)
+    assert count == len(rows)
+
+
+async def test_get_data_rows_selected_columns(db_session, bulk_experiment):
+    """Test that get_data_rows returns only the requested known columns."""
+    table_name, experiment_uuid = bulk_experiment
+    await ExperimentDataService.insert_many(
+        table_name, experiment_uuid, [{"participant_id": "P001", "score": 7}], db_session
+    )
+
+    rows = await ExperimentDataService.get_data_rows(
+        table_name, db_session, columns=["participant_id", "score", "missing"]
+    )
+
+    assert [dict(row) for row in rows] == [{"participant_id": "P001", "score": 7}]
+
+
+async def test_get_data_rows_keyset_pagination(db_session, bulk_experiment):
+    """Test that keyset pagination walks every row exactly once."""
+    table_name, experiment_uuid = bulk_experiment
+    rows = [{"participant_id": f"P{i:03d}", "score": i} for i in range(5)]
+    await ExperimentDataService.insert_many(table_name, experiment_uuid, rows, db_session)
+
+    seen = []
+    cursor = {}
+    while True:
+        page = await ExperimentDataService.get_data_rows(table_name, db_session, limit=2, **cursor)
+        if not page:
+            break
+        seen.extend(row["id"] for row in page)
+        cursor = {"after_created_at": page[-1]["created_at"], "after_id": page[-1]["id"]}
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+async def test_reflect_many(db_session, bulk_experiment):
+    """Test that reflect_many caches existing tables and skips missing ones."""
+    table_name, _ = bulk_experiment
+    ExperimentDataService._forget_table(table_name)
+
+    tables = await ExperimentDataService.reflect_many([table_name, "no_such_table"], db_session)
+
+    assert list(tables) == [table_name]
+    assert ExperimentDataService._table_cache[table_name] is tables[table_name]
+
+
+async def test_create_experiment_table_long_name(db_session):
+    """Test that table names near the identifier limit still get their indexes."""
+    table_name = "long_table_name_" + "x" * 46
+
+    created = await ExperimentDataService.create_experiment_table(
+        table_name, {"score": "INTEGER"}, db_session
+    )
+
+    assert len(table_name) > 60
+    assert created is True
+    assert await ExperimentDataService.get_table_reflected(table_name, db_session) is not None
+
+
+async def test_by_id_on_missing_table_keeps_session_usable(db_session, bulk_experiment):
+    """Test that raw by-ID SQL on a missing table leaves the session's transaction intact."""
+    table_name, _ = bulk_experiment
+
+    assert await ExperimentDataService.get_data_row_by_id("no_such_table", 1, db_session) is None
+    assert await ExperimentDataService.delete_data_row("no_such_table", 1, db_session) is False
+
+    assert await ExperimentDataService.count_data_rows(table_name, db_session) == 0
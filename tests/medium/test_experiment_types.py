@@ -4,6 +4,9 @@ import time
 
 import pytest
 
+from wave_backend.schemas.schemas import ExperimentTypeCreate
+from wave_backend.services.experiment_types import ExperimentTypeService
+
 
 @pytest.mark.asyncio
 async def test_create_experiment_type_api(async_client):
@@ -66,3 +69,22 @@ async def test_create_duplicate_experiment_type_api(async_client):
     )
     assert response.status_code == 400
     assert "already exists" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_get_experiment_types_by_names(db_session):
+    """Test resolving several experiment type names in one call."""
+    timestamp = str(int(time.time() * 1000))
+    names = [f"batch-lookup-{i}-{timestamp}" for i in range(2)]
+    for i, name in enumerate(names):
+        await ExperimentTypeService.create_experiment_type(
+            db_session,
+            ExperimentTypeCreate(name=name, table_name=f"batch_lookup_{i}_{timestamp}"),
+        )
+
+    found = await ExperimentTypeService.get_experiment_types_by_names(
+        db_session, names + ["missing-type"]
+    )
+
+    assert set(found) == set(names)
+    assert all(found[name].name == name for name in names)
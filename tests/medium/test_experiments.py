@@ -1,8 +1,19 @@
 """Simple tests for experiment operations."""
 
 import time
+from uuid import uuid4
 
 import pytest
+from sqlalchemy import text
+
+from wave_backend.models.models import create_missing_indexes
+from wave_backend.schemas.schemas import (
+    ExperimentCreate,
+    ExperimentTypeCreate,
+    ExperimentUpdate,
+)
+from wave_backend.services.experiment_types import ExperimentTypeService
+from wave_backend.services.experiments import ExperimentService
 
 
 @pytest.mark.asyncio
@@ -45,6 +56,37 @@ async def test_create_experiment_api(async_client):
     assert "created_at" in data
 
 
+@pytest.mark.asyncio
+async def test_create_experiment_missing_tag_api(async_client):
+    """Test that creating an experiment with an unknown tag is rejected."""
+    headers = {"Authorization": "Bearer test_token"}
+    timestamp = str(int(time.time() * 1000))
+    exp_type_data = {
+        "name": f"missing-tag-experiment-type-{timestamp}",
+        "description": "Test experiment type",
+        "table_name": f"missing_tag_experiment_table_{timestamp}",
+    }
+    exp_type_response = await async_client.post(
+        "/api/v1/experiment-types/", json=exp_type_data, headers=headers
+    )
+    exp_type_id = exp_type_response.json()["id"]
+
+    tag_data = {"name": "missing-check-tag", "description": "Existing tag"}
+    await async_client.post("/api/v1/tags/", json=tag_data, headers=headers)
+
+    experiment_data = {
+        "experiment_type_id": exp_type_id,
+        "description": "Experiment with a missing tag",
+        "tags": ["missing-check-tag", f"no-such-tag-{timestamp}"],
+    }
+    response = await async_client.post(
+        "/api/v1/experiments/", json=experiment_data, headers=headers
+    )
+
+    assert response.status_code == 400
+    assert f"no-such-tag-{timestamp}" in response.json()["detail"]
+
+
 @pytest.mark.asyncio
 async def test_get_experiments_api(async_client):
     """Test getting experiments via API."""
@@ -109,3 +151,37 @@ async def test_get_experiment_columns_api(async_client):
     assert "columns" in data
     assert data["experiment_uuid"] == experiment_uuid
     assert len(data["columns"]) > 0
+
+
+async def test_create_missing_indexes_on_existing_table(db_connection):
+    """Test that indexes missing from an existing experiments table are created."""
+    await db_connection.execute(text("DROP INDEX ix_experiments_type_created"))
+    await db_connection.execute(text("DROP INDEX ix_experiments_tags_gin"))
+
+    await db_connection.run_sync(create_missing_indexes)
+
+    result = await db_connection.execute(
+        text("SELECT indexname FROM pg_indexes WHERE tablename = 'experiments'")
+    )
+    assert {"ix_experiments_type_created", "ix_experiments_tags_gin"} <= set(result.scalars())
+
+
+async def test_update_experiment_unknown_tag_precedence(db_session):
+    """Test that a missing experiment wins over unknown tags, and unknown tags roll back."""
+    update = ExperimentUpdate(description="Updated", tags=["no-such-tag"])
+    assert await ExperimentService.update_experiment(db_session, uuid4(), update) is None
+
+    exp_type = await ExperimentTypeService.create_experiment_type(
+        db_session,
+        ExperimentTypeCreate(name="tag_precedence_test", table_name="tag_precedence_test_data"),
+    )
+    experiment = await ExperimentService.create_experiment(
+        db_session,
+        ExperimentCreate(experiment_type_id=exp_type.id, description="Original"),
+    )
+
+    with pytest.raises(ValueError, match="no-such-tag"):
+        await ExperimentService.update_experiment(db_session, experiment.uuid, update)
+
+    unchanged = await ExperimentService.get_experiment(db_session, experiment.uuid)
+    assert unchanged.description == "Original"
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import text
 
 from wave_backend.schemas.schemas import (
     ExperimentCreate,
@@ -327,6 +328,18 @@ async def test_pagination(db_session, search_test_setup):
     assert len(results) == 0
 
 
+@pytest.mark.asyncio
+async def test_search_experiment_summaries_by_tags(db_session, search_test_setup):
+    """Test tag search returning summary rows with the type name and table."""
+    rows = await SearchService.search_experiment_summaries_by_tags(db_session, tags=["behavioral"])
+
+    assert len(rows) == 1
+    assert rows[0].description == "Memory recall with word lists"
+    assert rows[0].tags == ["cognitive", "behavioral"]
+    assert rows[0].experiment_type_name == "memory_test"
+    assert rows[0].table_name == "memory_test_table"
+
+
 @pytest.mark.asyncio
 async def test_get_experiment_data_by_tags(db_session, search_test_setup):
     """Test getting experiment data by tags."""
@@ -367,6 +380,42 @@ async def test_get_experiment_data_by_tags(db_session, search_test_setup):
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_experiment_data_by_tags_pagination(db_session, search_test_setup):
+    """Test that data-by-tags pages across experiments without overlapping rows."""
+    pages = [
+        await SearchService.get_experiment_data_by_tags(
+            db_session, tags=["neural"], match_all=False, skip=skip, limit=1
+        )
+        for skip in (0, 1, 2)
+    ]
+
+    assert [len(page["data"]) for page in pages] == [1, 1, 0]
+    assert all(page["total_rows"] == 2 for page in pages)
+    first, second = pages[0]["data"][0], pages[1]["data"][0]
+    assert (
+        first["experiment_metadata"]["experiment_uuid"]
+        != second["experiment_metadata"]["experiment_uuid"]
+    )
+    assert first["created_at"] >= second["created_at"]
+    data_counts = [info["data_count"] for info in pages[0]["experiment_info"].values()]
+    assert data_counts == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_experiment_data_by_tags_across_tables(db_session, search_test_setup):
+    """Test that a data-by-tags page spanning several data tables returns every row."""
+    result = await SearchService.get_experiment_data_by_tags(
+        db_session, tags=["cognitive"], match_all=False, limit=10
+    )
+
+    assert result["total_rows"] == 2
+    by_participant = {row["participant_id"]: row for row in result["data"]}
+    assert set(by_participant) == {"PARTICIPANT_001", "PARTICIPANT_003"}
+    assert by_participant["PARTICIPANT_001"]["stimulus_type"] == "visual"
+    assert by_participant["PARTICIPANT_003"]["word_count"] == 20
+
+
 @pytest.mark.asyncio
 async def test_search_with_empty_results(db_session, search_test_setup):
     """Test search methods with queries that return no results."""
@@ -389,3 +438,18 @@ async def test_search_with_empty_results(db_session, search_test_setup):
     assert result["total_experiments"] == 0
     assert result["total_rows"] == 0
     assert len(result["data"]) == 0
+
+
+async def test_trigram_indexes_created(db_session):
+    """Test that startup index creation built the trigram search indexes."""
+    result = await db_session.execute(
+        text("SELECT indexname FROM pg_indexes WHERE indexname LIKE '%\\_trgm'")
+    )
+
+    assert set(result.scalars()) == {
+        "ix_tags_name_trgm",
+        "ix_tags_description_trgm",
+        "ix_experiment_types_name_trgm",
+        "ix_experiment_types_description_trgm",
+        "ix_experiments_description_trgm",
+    }
@@ -48,3 +48,31 @@ async def test_create_duplicate_tag_api(async_client):
     response = await async_client.post("/api/v1/tags/", json=tag_data, headers=headers)
     assert response.status_code == 400
     assert "already exists" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_update_tag_name_conflict_api(async_client):
+    """Test renaming a tag to another tag's name is rejected, but keeping its own is not."""
+    headers = {"Authorization": "Bearer test_token"}
+    timestamp = str(int(time.time() * 1000))
+    first = await async_client.post(
+        "/api/v1/tags/", json={"name": f"rename-first-{timestamp}"}, headers=headers
+    )
+    second = await async_client.post(
+        "/api/v1/tags/", json={"name": f"rename-second-{timestamp}"}, headers=headers
+    )
+    tag_id = second.json()["id"]
+
+    response = await async_client.put(
+        f"/api/v1/tags/{tag_id}", json={"name": first.json()["name"]}, headers=headers
+    )
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+    response = await async_client.put(
+        f"/api/v1/tags/{tag_id}",
+        json={"name": f"rename-second-{timestamp}", "description": "Same name"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["description"] == "Same name"
@@ -0,0 +1,35 @@
+"""Unit tests for the ExperimentService base column cache."""
+
+from types import SimpleNamespace
+
+from wave_backend.schemas.schemas import ColumnTypeInfo
+from wave_backend.services.experiments import ExperimentService
+
+
+class _FakeEngine:
+    """Hashable stand-in for an Engine, which reports itself as its own engine."""
+
+    @property
+    def engine(self):
+        return self
+
+
+async def test_cached_base_columns_skip_reflection():
+    """Test that cached experiments columns are returned without reflecting again."""
+    engine = _FakeEngine()
+
+    async def run_sync(fn):
+        raise AssertionError("reflection should not run on a cache hit")
+
+    db = SimpleNamespace(get_bind=lambda: engine, run_sync=run_sync)
+    cached = (ColumnTypeInfo(column_name="uuid", column_type="UUID", is_nullable=False),)
+    ExperimentService._base_columns_cache[engine] = cached
+    try:
+        response = await ExperimentService.get_experiment_columns(
+            db, experiment_type_name="cached_type"
+        )
+    finally:
+        ExperimentService._base_columns_cache.pop(engine)
+
+    assert response.experiment_type == "cached_type"
+    assert response.columns == list(cached)
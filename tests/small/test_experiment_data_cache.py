@@ -0,0 +1,106 @@
+"""Unit tests for the ExperimentDataService reflected table cache."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+
+from wave_backend.services.experiment_data import (
+    COPY_MIN_ROWS,
+    ExperimentDataService,
+    _index_name,
+    _metadata,
+)
+
+
+async def test_cached_table_skips_reflection():
+    """Test that a cached table is returned without touching the database."""
+    table = Table("cache_test_data", _metadata, Column("id", Integer))
+    ExperimentDataService._table_cache["cache_test_data"] = table
+    try:
+        # No session is needed on a cache hit
+        assert await ExperimentDataService.get_table_reflected("cache_test_data", None) is table
+        assert ExperimentDataService._column_names(table) == {"id"}
+    finally:
+        ExperimentDataService._forget_table("cache_test_data")
+
+    assert "cache_test_data" not in ExperimentDataService._table_cache
+    assert "cache_test_data" not in ExperimentDataService._column_set_cache
+    assert "cache_test_data" not in _metadata.tables
+
+
+async def test_uncached_plain_table_uses_raw_sql():
+    """Test that by-ID lookups on an uncached plain table name skip reflection."""
+    db = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=postgresql.dialect()))
+
+    query, params = await ExperimentDataService._by_id_for_table_name(
+        "Raw_Test_Data", "delete", 7, "0b0e7c8e-2a7b-4a49-9a8e-2f4c3f1b2d6e", db
+    )
+
+    assert str(query) == (
+        'DELETE FROM "Raw_Test_Data" WHERE id = :_row_id AND experiment_uuid = :_experiment_uuid'
+    )
+    assert params == {"_row_id": 7, "_experiment_uuid": "0b0e7c8e-2a7b-4a49-9a8e-2f4c3f1b2d6e"}
+
+
+def test_index_name_fits_identifier_limit():
+    """Test that index names for long table names are shortened to 63 characters."""
+    assert _index_name("short_data", "uuid_created") == "ix_short_data_uuid_created"
+
+    table_name = "t" * 100
+    name = _index_name(table_name, "participant_created")
+    assert len(name) == 63
+    assert name == _index_name(table_name, "participant_created")
+    assert name != _index_name(table_name, "uuid_created")
+
+
+@pytest.mark.parametrize("row_count", [3, COPY_MIN_ROWS])
+async def test_bulk_insert_rejects_server_managed_columns(row_count):
+    """Test that both bulk insert paths reject rows that set server-managed columns."""
+    table = Table("managed_test_data", _metadata, Column("id", Integer))
+    ExperimentDataService._table_cache["managed_test_data"] = table
+    rows = [{"participant_id": "P001", "id": i} for i in range(row_count)]
+    try:
+        # Rejected before any SQL, so no session is needed
+        with pytest.raises(ValueError, match="Server-managed columns"):
+            await ExperimentDataService.insert_data_rows(
+                "managed_test_data", "0b0e7c8e-2a7b-4a49-9a8e-2f4c3f1b2d6e", rows, None
+            )
+    finally:
+        ExperimentDataService._forget_table("managed_test_data")
+
+
+class _FailingSession:
+    """Session stand-in whose statements fail and which records rollbacks."""
+
+    def __init__(self):
+        self.rolled_back = False
+
+    async def execute(self, *args, **kwargs):
+        raise SQLAlchemyError("insert failed")
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+async def test_bulk_insert_failure_leaves_caller_transaction(autocommit):
+    """Test that a failed bulk insert only rolls back when it owns the transaction."""
+    table = Table("rollback_test_data", _metadata, Column("id", Integer), Column("score", Integer))
+    ExperimentDataService._table_cache["rollback_test_data"] = table
+    db = _FailingSession()
+    try:
+        row_ids = await ExperimentDataService.insert_many(
+            "rollback_test_data",
+            "0b0e7c8e-2a7b-4a49-9a8e-2f4c3f1b2d6e",
+            [{"score": 1}],
+            db,
+            autocommit=autocommit,
+        )
+    finally:
+        ExperimentDataService._forget_table("rollback_test_data")
+
+    assert row_ids is None
+    assert db.rolled_back is autocommit
@@ -1,5 +1,7 @@
 """Unit tests for schema validation of experiment data."""
 
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -7,6 +9,7 @@ from wave_backend.schemas.schemas import (
     SUPPORTED_COLUMN_TYPES,
     ColumnDefinition,
     ExperimentDataCreate,
+    ExperimentDataQueryRequest,
     ExperimentDataUpdate,
     ExperimentTypeCreate,
 )
@@ -200,3 +203,22 @@ class TestExperimentDataUpdate:
         data = ExperimentDataUpdate(participant_id="PART-003")
         assert data.participant_id == "PART-003"
         assert data.data is None
+
+
+class TestExperimentDataQueryRequest:
+    """Test cases for ExperimentDataQueryRequest schema validation."""
+
+    def test_filter_keys_interned(self):
+        """Test that filter keys are interned and values preserved."""
+        key = "".join(["reaction", "_time"])
+        query = ExperimentDataQueryRequest(filters={key: 1.23})
+        (filter_key,) = query.filters
+        assert filter_key is sys.intern("reaction_time")
+        assert query.filters["reaction_time"] == 1.23
+
+    def test_keyset_cursor_requires_both_fields(self):
+        """Test that after_created_at and after_id must be given together."""
+        with pytest.raises(ValidationError) as exc_info:
+            ExperimentDataQueryRequest(after_id=42)
+
+        assert "must be provided together" in str(exc_info.value)
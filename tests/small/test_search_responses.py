@@ -0,0 +1,27 @@
+"""Unit tests for search list-response serialization."""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from wave_backend.api.routes.search import _TAG_LIST_ADAPTER, _list_response
+from wave_backend.schemas.schemas import TagResponse
+from wave_backend.schemas.search_schemas import TagSearchResponse
+
+
+def test_list_response_matches_response_model():
+    """Test cached adapter output matches the declared response model."""
+    now = datetime(2024, 1, 15, 10, 30)
+    tags = [
+        SimpleNamespace(id=i, name=f"tag_{i}", description=None, created_at=now, updated_at=now)
+        for i in range(3)
+    ]
+
+    response = _list_response(_TAG_LIST_ADAPTER, "tags", tags, skip=0, limit=10)
+
+    expected = TagSearchResponse(
+        tags=[TagResponse.model_validate(tag) for tag in tags],
+        total=3,
+        pagination={"skip": 0, "limit": 10, "total": 3},
+    ).model_dump(mode="json")
+    assert json.loads(response.body) == expected
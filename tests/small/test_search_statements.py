@@ -0,0 +1,25 @@
+"""Unit tests for cached search statements."""
+
+from sqlalchemy.dialects import postgresql
+
+from wave_backend.services.search import SearchService
+
+
+def test_tag_search_statement_reuses_cache_key():
+    """Test that tag searches differing only in values share one cache key."""
+    first = SearchService._experiments_by_tags_statement(["a", "b"], True, 0, 10, None, None)
+    second = SearchService._experiments_by_tags_statement(["c"], True, 5, 20, None, None)
+
+    assert first._generate_cache_key().key == second._generate_cache_key().key
+
+    params = second.compile(dialect=postgresql.dialect()).params
+    assert params == {"tags_1": ["c"], "skip_1": 5, "limit_1": 20}
+
+
+def test_match_any_tag_search_uses_array_overlap():
+    """Test that match-any searches use one && test regardless of the number of tags."""
+    one = SearchService._experiments_by_tags_statement(["a"], False, 0, 10, None, None)
+    three = SearchService._experiments_by_tags_statement(["a", "b", "c"], False, 0, 10, None, None)
+
+    assert one._generate_cache_key().key == three._generate_cache_key().key
+    assert "experiments.tags && " in str(three.compile(dialect=postgresql.dialect()))
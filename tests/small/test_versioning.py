@@ -2,12 +2,16 @@
 Tests for versioning utilities and middleware.
 """
 
+import logging
+
 import pytest
 
 from wave_backend.utils.versioning import (
     API_VERSION,
     get_compatibility_warning,
     is_compatible_version,
+    log_version_info,
+    logger,
     parse_version,
 )
 
@@ -37,6 +41,20 @@ class TestVersionParsing:
         with pytest.raises(ValueError):
             parse_version("invalid")
 
+        with pytest.raises(ValueError):
+            parse_version("1..0")
+
+        with pytest.raises(ValueError):
+            parse_version("1.0.-1")
+
+    def test_parse_version_is_memoized(self):
+        """Test repeated parses are served from the cache."""
+        parse_version.cache_clear()
+        parse_version("3.2.1")
+        parse_version("3.2.1")
+
+        assert parse_version.cache_info().hits == 1
+
 
 class TestVersionCompatibility:
     """Test version compatibility checking."""
@@ -59,6 +77,17 @@ class TestVersionCompatibility:
         """Test handling of invalid versions."""
         assert is_compatible_version("invalid", "1.0.0") is False
         assert is_compatible_version("1.0.0", "invalid") is False
+        # Equal strings are only compatible when they are valid versions
+        assert is_compatible_version("invalid", "invalid") is False
+        assert is_compatible_version(API_VERSION, API_VERSION) is True
+
+    def test_malformed_version_with_matching_major(self):
+        """Test that sharing the API major does not make a malformed version compatible."""
+        api_major = API_VERSION.split(".")[0]
+
+        assert is_compatible_version(f"{api_major}.x", API_VERSION) is False
+        assert is_compatible_version(f"{api_major}.0", API_VERSION) is False
+        assert is_compatible_version(f"{api_major}.0.0.0", API_VERSION) is False
 
 
 class TestCompatibilityWarnings:
@@ -86,6 +115,14 @@ class TestCompatibilityWarnings:
         assert warning is not None
         assert "Major version mismatch" in warning
 
+    def test_warning_is_memoized(self):
+        """Test repeated warnings for the same versions are served from the cache."""
+        get_compatibility_warning.cache_clear()
+        first = get_compatibility_warning("9.0.0", API_VERSION)
+
+        assert get_compatibility_warning("9.0.0", API_VERSION) is first
+        assert get_compatibility_warning.cache_info().hits == 1
+
     def test_warning_for_invalid_versions(self):
         """Test warning for invalid version formats."""
         warning = get_compatibility_warning("invalid", "1.0.0")
@@ -93,6 +130,19 @@ class TestCompatibilityWarnings:
         assert "Invalid version format" in warning
 
 
+class TestVersionLogging:
+    """Test version logging behavior."""
+
+    def test_silenced_logger_skips_compatibility_check(self, caplog):
+        """Test nothing is computed when the logger filters out warnings."""
+        caplog.set_level(logging.ERROR, logger=logger.name)
+        get_compatibility_warning.cache_clear()
+
+        log_version_info("9.0.0", "wave-python-client/9.0.0")
+
+        assert get_compatibility_warning.cache_info().misses == 0
+
+
 class TestAPIVersionConstant:
     """Test API version constant."""
 